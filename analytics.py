@@ -1,63 +1,172 @@
-import requests
 import regex as re
 import pandas as pd
+import numpy as np
 import cbs
 import os
 import sys
 import statistics
-from matplotlib import pyplot as plt
-import seaborn as sns
-import matplotlib as mpl
 import warnings
 from pathlib import Path
-from sklearn.preprocessing import MinMaxScaler
+import hashlib
+import logging
+import time
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
 #%matplotlib inline
 
-def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
+# Plotting modules are only imported once something is drawn
+plt = cbs.LazyModule("matplotlib.pyplot")
+sns = cbs.LazyModule("seaborn")
+mpl = cbs.LazyModule("matplotlib")
+
+# Child of the cbs logger, so messages go to its log file (logs/commentscrape.log) once a CBS instance exists
+logger = logging.getLogger(f"{cbs.__name__}.analytics")
+
+_aggregates_cache = {}
+
+COLOR_MAP = ['#0f668f', '#6182af', '#9a9fcc', '#cfbee6', '#ffdfff', '#f7b8e0', '#f190b8', '#e76787', '#de425b']
+
+def _record_key(record):
+    """ Content hash of a record df; used as the key of the analytics caches """
+    return hashlib.sha256(pd.util.hash_pandas_object(record, index=True).to_numpy().tobytes()).hexdigest()
+
+class LeagueAggregates:
+    """ Per-period league aggregates of a record df, each computed once on first use and shared by the analytics functions """
     
-    """Outputs relative stat strengths of all teams; outputs power rankings with Prankings toggle"""
+    cats = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
+    cats_m = ['min', '3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
     
-    def _team_processor(record, l_team:str, period:list):
-        
-        """Processes teams as needed; converts stat totals to standard z scores and normalizes negative values"""
-        
-        columns = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb', 'max', 'min', 'team', 'mins', 'period']
-        cats = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
-        
-        graph_df = pd.DataFrame(columns=cats)
-        
-        for p in period:
-        
-            working_df = record.loc[record['period'] == p].drop(columns=['opponent', 'score', 'period'])
-            
-            scaler = MinMaxScaler()
-            scaled = scaler.fit_transform(working_df).round(2) + 0.2
+    def __init__(self, record):
+        self.record = record
+        self._tensors = {}
+    
+    @cached_property
+    def totals(self):
+        """ Stat totals as floats, indexed by (team, period) """
+        totals = self.record[self.cats_m].astype(float)
+        totals.index = pd.MultiIndex.from_arrays([self.record.index, self.record['period'].astype(int)], names=['team', 'period'])
+        return totals
+    
+    @cached_property
+    def stats(self):
+        """ min/max/median/mean of every cat per period (columns are (cat, stat)) """
+        return self.totals.groupby(level='period').agg(['min', 'max', 'median', 'mean'])
+    
+    @cached_property
+    def ranks(self):
+        """ Every team's per-period rank in each cat (1 is best; 'to' ranks in reverse) """
+        grouped = self.totals[self.cats].groupby(level='period')
+        ranks = grouped.rank(ascending=False, method='min')
+        ranks['to'] = grouped['to'].rank(ascending=True, method='min')
+        return ranks
+    
+    @cached_property
+    def normalized(self):
+        """ Per-period min-max normalization of every team's stat totals (rounded, +0.2) """
+        working_df = self.record.drop(columns=['opponent', 'score', 'wins', 'losses', 'ties', 'period'], errors='ignore').astype(float)
+        
+        #Same arithmetic as MinMaxScaler (x * scale + min, constant columns get a scale of 1), grouped by period
+        grouped = working_df.groupby(self.record['period'])
+        data_min = grouped.transform('min')
+        data_range = grouped.transform('max') - data_min
+        scale = 1 / data_range.where(data_range >= 10 * np.finfo(np.float64).eps, 1)
+        normalized = (working_df * scale + (0 - data_min * scale)).round(2) + 0.2
+        
+        normalized = normalized[self.cats + [x for x in normalized.columns if x not in self.cats]]
+        normalized['period'] = self.record['period'].astype(int)
+        return normalized
+    
+    def team_totals(self, team: str, period: list):
+        """ A team's stat totals over the given periods (indexed by period) """
+        return self.totals.xs(team, level='team').reindex(period)
+    
+    def faceoff_tensor(self, period: list):
+        """ Head-to-head results for every (period, team, opponent, cat): 1 win, -1 loss, 0 tie (NaN if missing); 'to' counts in reverse """
+        key = tuple(period)
+        if key not in self._tensors:
+            teams = self.record.loc[self.record['period'] == period[0]].index.to_list()
             
-            normalized_period = pd.DataFrame(data=scaled, columns=working_df.columns, index=working_df.index)
-            normalized_period['period'] = p
+            #(period x team x cat) totals, then every team against every other team by broadcasting
+            stacked = self.totals.swaplevel().reindex(pd.MultiIndex.from_product([period, teams]))[self.cats]
+            totals = stacked.to_numpy(dtype=float).reshape(len(period), len(teams), len(self.cats))
             
-            #Convert back to df
-            graph_df = pd.concat([graph_df, normalized_period]).astype({'period':int})
-        
-        #Output a given team
-        graph_df = graph_df.loc[graph_df.index == l_team]
-        
-        
-        graph_df.index = graph_df['period']
-        graph_df.drop(columns=['period'], inplace=True)
-        
-        return graph_df
+            results = np.sign(totals[:, :, None, :] - totals[:, None, :, :])
+            results[..., self.cats.index('to')] *= -1
+            self._tensors[key] = (results, teams, self.cats)
+        return self._tensors[key]
+
+def aggregates(record):
+    """ Shared LeagueAggregates for a record df, keyed by its content (cleared after every CBS.update()) """
+    key = _record_key(record)
+    if key not in _aggregates_cache:
+        if len(_aggregates_cache) >= 8:
+            _aggregates_cache.clear()
+        _aggregates_cache[key] = LeagueAggregates(record)
+    return _aggregates_cache[key]
+
+@cbs.register_update_hook
+def clear_aggregates():
+    """ Drops every cached LeagueAggregates (registered as a CBS.update() hook) """
+    _aggregates_cache.clear()
+
+def _strength_frame(record, team: str, period: list):
+    """ A team's per-period normalized stat totals (strength chart data) """
+    normalized = aggregates(record).normalized
+    return normalized.loc[normalized.index == team].set_index('period').reindex(period)
 
+def _draw_strengths(graph_df, minutes, team: str, period: list, path):
+    """ Draws a team's stacked cat strengths with a minutes line and saves it to path """
+    fig, ax = plt.subplots(figsize=(8,6))
+    
+    stacks = plt.stackplot(
+    graph_df.index,
+    graph_df['3pt'], graph_df['ast'], graph_df['bk'], graph_df['fgp'], graph_df['ftp'],
+    graph_df['pts'], graph_df['st'], graph_df['to'], graph_df['trb'],
+    colors=COLOR_MAP, edgecolor='black', linewidth=0.5)
+    
+    last_y = 0
+    
+    for stack, category in zip(stacks, graph_df.columns):
+        p = stack.get_paths()[0]
+        mask = p.vertices[:,0] == period[-1]
+        filtered_values = p.vertices[mask][:,1]
+        new_y = filtered_values.max() 
+        y = statistics.median([last_y, new_y])
+        x = period [-1] 
+        plt.annotate(f'{category.upper()}', xy=(x, y), color='black', fontsize=10)
+        last_y = new_y
+        
+    ax2 = ax.twinx()
+    ax2.plot(graph_df.index, minutes, '--', scaley=True)
+    ax2.set_ylim(850, 1450)
+    
+    plt.subplots_adjust(left=0.1, right=1.5, top=0.9, bottom=0.1)
+    plt.tick_params(left=False) 
+    plt.title(team)
+    
+    plt.tight_layout()
+    plt.savefig(path)
+
+def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
+    
+    """Outputs relative stat strengths of all teams; outputs power rankings with Prankings toggle"""
+    
     def _prankings():
         
         """ Calculates power rankings based on standardized strengths across cats """
 
-        output_df = pd.DataFrame(columns=record.loc[record['period'] == period[-1]].index, index=period)
-        for p in period:
-            for man in output_df.columns:      
-                #print(f'{man}', _team_processor(record, man, period))
-                output_df.at[p, man] = _team_processor(record, man, period).loc[p].sum().round(1)
-            
+        normalized = agg.normalized
+        selected = normalized.loc[normalized['period'].isin(period)]
+        
+        #Row totals (cats added left to right)
+        totals = np.zeros(len(selected))
+        for x in selected.columns.drop('period'):
+            totals = totals + selected[x].to_numpy()
+        
+        output_df = pd.DataFrame({'period': selected['period'].to_numpy(), 'team': selected.index, 'total': totals.round(1)})
+        output_df = output_df.pivot(index='period', columns='team', values='total')
+        output_df = output_df.reindex(index=period, columns=record.loc[record['period'] == period[-1]].index)
+        output_df.index.name = None
         
         print('\n\n',output_df,'\n\n')
 
@@ -67,13 +176,14 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
         print('Team not recognized')
         return
     
+    agg = aggregates(record)
+    
     #Output power-rankings if Prankings toggle true. 
     if Prankings == True:
         _prankings()
         return
     
     #If plotting the results (Prankings == False)
-    color_map = ['#0f668f', '#6182af', '#9a9fcc', '#cfbee6', '#ffdfff', '#f7b8e0', '#f190b8', '#e76787', '#de425b']
     
     
     if multi == True:
@@ -84,18 +194,14 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
         #Drop my own team (will be in a different pop-up)
         temp_record = record.drop('Taints', axis=0)
         
-        #Establish the timeframe for minutes based on argument input
-        timeframe = record.loc[record['period'].isin(period)]
-        timeframe = timeframe[['min', 'period']]
-        
         for n, z_team in enumerate(temp_record.loc[temp_record['period'] == period[0]].index):
-            graph_df = _team_processor(record, z_team, period)
+            graph_df = _strength_frame(record, z_team, period)
             position_list = [[0, 0], [0, 1], [0, 2], [1, 0], [1, 1], [1, 2], [2, 0], [2, 1], [2, 2]]
 
             stacks = ax[position_list[n][0]][position_list[n][1]].axes.stackplot(graph_df.index,
                                     graph_df['3pt'], graph_df['ast'], graph_df['bk'], graph_df['fgp'], graph_df['ftp'],
                                     graph_df['pts'], graph_df['st'], graph_df['to'], graph_df['trb'],
-                                    colors=color_map, edgecolor='black', linewidth=0.5)
+                                    colors=COLOR_MAP, edgecolor='black', linewidth=0.5)
             
             ax[position_list[n][0]][position_list[n][1]].axes.set_xticks(graph_df.index)
             
@@ -104,7 +210,7 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
             #print(graph_df.index, '\n\n')
             #print(record['min'].loc['Taints'])
             
-            ax2.plot(graph_df.index, timeframe['min'].loc[z_team], '--', scaley=True)
+            ax2.plot(graph_df.index, agg.team_totals(z_team, period)['min'], '--', scaley=True)
             ax2.set_ylim(850, 1450)
             
             last_y = 0
@@ -129,13 +235,13 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
         #Plot my team for comparison
         fig, ax = plt.subplots(figsize=(8,6))
         
-        graph_df = _team_processor(record, 'Taints', period)
+        graph_df = _strength_frame(record, 'Taints', period)
         
         stacks = plt.stackplot(
         graph_df.index,
         graph_df['3pt'], graph_df['ast'], graph_df['bk'], graph_df['fgp'], graph_df['ftp'],
         graph_df['pts'], graph_df['st'], graph_df['to'], graph_df['trb'],
-        colors=color_map, edgecolor='black', linewidth=0.5)
+        colors=COLOR_MAP, edgecolor='black', linewidth=0.5)
         
         last_y = 0
         for stack, category in zip(stacks, graph_df.columns):
@@ -155,7 +261,7 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
 
         #Add a minutes line
         ax2 = ax.twinx()
-        ax2.plot(graph_df.index, timeframe['min'].loc['Taints'], '--', scaley=True)
+        ax2.plot(graph_df.index, agg.team_totals('Taints', period)['min'], '--', scaley=True)
         ax2.set_ylim(850, 1450)
         
         plt.tick_params(left=False, right=False) 
@@ -165,85 +271,32 @@ def team_strengths(record, team:str, period:list, multi=False, Prankings=False):
     
     #Single plot
     else:
-        graph_df = _team_processor(record, team, period)
-        
-        fig, ax = plt.subplots(figsize=(8,6))
-        
-        stacks = plt.stackplot(
-        graph_df.index,
-        graph_df['3pt'], graph_df['ast'], graph_df['bk'], graph_df['fgp'], graph_df['ftp'],
-        graph_df['pts'], graph_df['st'], graph_df['to'], graph_df['trb'],
-        colors=color_map, edgecolor='black', linewidth=0.5)
-        
-        last_y = 0
-        
-        for stack, category in zip(stacks, graph_df.columns):
-            p = stack.get_paths()[0]
-            mask = p.vertices[:,0] == period[-1]
-            filtered_values = p.vertices[mask][:,1]
-            new_y = filtered_values.max() 
-            y = statistics.median([last_y, new_y])
-            x = period [-1] 
-            plt.annotate(f'{category.upper()}', xy=(x, y), color='black', fontsize=10)
-            last_y = new_y
-            
-        ax2 = ax.twinx()
-        ax2.plot(graph_df.index, record['min'].loc[team], '--', scaley=True)
-        ax2.set_ylim(850, 1450)
-        
-        plt.subplots_adjust(left=0.1, right=1.5, top=0.9, bottom=0.1)
-        plt.tick_params(left=False) 
-        plt.title(team)
-        
-        plt.tight_layout()
-        plt.savefig(Path(__file__).parent / f"images/team_strength_{team}.png")
+        graph_df = _strength_frame(record, team, period)
+        _draw_strengths(graph_df, agg.team_totals(team, period)['min'], team, period, Path(__file__).parent / f"images/team_strength_{team}.png")
 
-def snapshot(record, team: str, period: list):
-    """ This is a function that assesses a team's performance cat-by-cat against the league over a specified period """
+def _snapshot_frame(record, team: str, period: list):
+    """ Snapshot chart data: the league's min/max for each cat per period, the team's totals (-t) and the league medians (-m) """
     
     cats_m = ['min', '3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
     cats = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
     
-    if str(team) not in record.index:
-        print('Team not recognized')
-        return
+    agg = aggregates(record)
+    stats = agg.stats.reindex(period)
+    team_totals = agg.team_totals(team, period)
     
-    if len(period) < 2:
-        print('More than one period required')
-        return
+    #weekly minimums and maximums of various stat categories, then the team's totals and the league medians
+    graph_df = stats[[(cat, x) for cat in cats for x in ['min', 'max']]]
+    extra_df = pd.DataFrame(
+        {(f'{cat}-{x}', ''): values for cat in cats_m for x, values in [('t', team_totals[cat]), ('m', stats[(cat, 'median')])]},
+        index=stats.index,
+    )
     
-    #Outputs the necessary data: team total, max, min for each cat in the specified timeframe
-    def _df_processor(record, team:str, period:list):
-        cats = ['min', '3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
+    return pd.concat([graph_df, extra_df], axis=1)
 
-        team_totals = record.loc[team].set_index('period').drop(columns=['opponent', 'score'])
-        
-        #weekly minimums and maximums of various stat categories
-        weekly_totals = record.groupby('period')[['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']].agg(['min', 'max'])
-        
-        graph_df = pd.DataFrame()
-        
-        for p in period:
-            #All of the teams weekly stats
-            all_team_totals = record.loc[record['period'] == p]
-            
-            weekly_totals_slice = weekly_totals.loc[weekly_totals.index == p]
-            
-            
-            team_totals_slice = team_totals.loc[team_totals.index == p]
-
-            #Totals
-            for cat in cats_m:
-                weekly_totals_slice[f'{cat}-t'] = team_totals_slice[cat]
+def _draw_snapshot(graph_df, team: str, period: list, path):
+    """ Draws the 3x3 cat snapshot grid of a team and saves it to path """
     
-            #median
-                weekly_totals_slice[f'{cat}-m'] = all_team_totals[cat].median()
-    
-            graph_df = pd.concat([graph_df, weekly_totals_slice])
-            
-        return graph_df
-    
-    graph_df = _df_processor(record, team, period)
+    cats = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
     
     #Create the plot
     fig, ax = plt.subplots(3, 3, figsize=(22, 16))
@@ -276,68 +329,129 @@ def snapshot(record, team: str, period: list):
         
     
     plt.tight_layout()
-    plt.savefig("images/team_snapshot.png")
+    plt.savefig(path)
+
+def snapshot(record, team: str, period: list):
+    """ This is a function that assesses a team's performance cat-by-cat against the league over a specified period """
+    
+    if str(team) not in record.index:
+        print('Team not recognized')
+        return
+    
+    if len(period) < 2:
+        print('More than one period required')
+        return
+    
+    graph_df = _snapshot_frame(record, team, period)
+    _draw_snapshot(graph_df, team, period, "images/team_snapshot.png")
+
+def faceoff_matrix(record, period: list):
+    """ Hypothetical records for the whole league: every team against every other team in each period (matchups and cats won/lost/tied) """
+    
+    results, teams, cats = aggregates(record).faceoff_tensor(period)
+    
+    #Category counts per (period, team, opponent); a team doesn't play itself
+    cat_w = (results == 1).sum(axis=-1)
+    cat_l = (results == -1).sum(axis=-1)
+    cat_t = (results == 0).sum(axis=-1)
+    opponents = ~np.eye(len(teams), dtype=bool)[None, :, :]
+    
+    output_df = pd.DataFrame(
+        {
+            'w': ((cat_w > cat_l) & opponents).sum(axis=(0, 2)),
+            'l': ((cat_w < cat_l) & opponents).sum(axis=(0, 2)),
+            't': ((cat_w == cat_l) & opponents).sum(axis=(0, 2)),
+            'cat_w': (cat_w * opponents).sum(axis=(0, 2)),
+            'cat_l': (cat_l * opponents).sum(axis=(0, 2)),
+            'cat_t': (cat_t * opponents).sum(axis=(0, 2)),
+        },
+        index=pd.Index(teams, name='team'),
+    )
+    output_df['pct'] = ((output_df['w'] + 0.5 * output_df['t']) / (output_df[['w', 'l', 't']].sum(axis=1))).round(3)
+    
+    return output_df.sort_values(by='pct', ascending=False)
 
 def faceoff(record, team:str, period:list):
     """ Runs hypothetical matchups for a team against the field over specified periods; takes df for record input"""
     
-    cats = ['3pt', 'ast', 'bk', 'fgp', 'ftp', 'pts', 'st', 'to', 'trb']
-    
     if str(team) not in record.index:
         print('Team not recognized')
         return
     
-    team_total = record.loc[team].set_index('period').drop(columns=['opponent', 'score'])
-    field = record.loc[record['period'] == 1].index.to_list()
-    field.remove(team)
+    results, teams, cats = aggregates(record).faceoff_tensor(period)
+    n = teams.index(team)
+    field = [x for x in teams if x != team]
     
-    wins = 0
-    wins_list = []
-    losses = 0
-    losses_list = []
-    ties = 0
-    ties_list = []
-    
-    for p in period:
-        team_total_slice = team_total.iloc[p - 1]
-        record_slice = record.loc[record['period'] == (p)]
-        
+    for i, p in enumerate(period):
         for opp in field:
-            for cat in cats:
-                #print(f'{p} -- {opp} -- {cat}\n\n total 1: {team_total_slice[cat]} total 2: {record_slice.at[opp, cat]}')
-                #print(wins_list)
-                if cat != 'to':
-                    if team_total_slice[cat] > record_slice.at[opp, cat]:
-                        #print(f'WIN ', team_total_slice[cat], 'v ', record_slice.at[opp, cat])
-                        wins += 1
-                        wins_list.append(cat)
-                    elif team_total_slice[cat] == record_slice.at[opp, cat]:
-                        ties += 1
-                        ties_list.append(cat)
-                    elif team_total_slice[cat] < record_slice.at[opp, cat]:
-                        losses += 1
-                        losses_list.append(cat)
-                else:
-                    if team_total_slice[cat] < record_slice.at[opp, cat]:
-                        wins += 1
-                        wins_list.append(cat)
-                    elif team_total_slice[cat] == record_slice.at[opp, cat]:
-                        ties += 1
-                        ties_list.append(cat)
-                    elif team_total_slice[cat] > record_slice.at[opp, cat]:
-                        losses += 1
-                        losses_list.append(cat)
-                
-                result = 'win' if wins > losses else 'tie' if wins == losses else 'lose'
+            matchup = results[i, n, teams.index(opp)]
+            wins = int((matchup == 1).sum())
+            losses = int((matchup == -1).sum())
+            ties = int((matchup == 0).sum())
+            result = 'win' if wins > losses else 'tie' if wins == losses else 'lose'
             
             print(f'period {p} matchup between {team} and {opp}, {team} would {result} {wins}-{losses}-{ties}')
-            wins = 0
-            losses = 0
-            ties = 0
-            wins_list.clear()
         print('\n')
 
 
+def _faceoff_frame(record, team: str, period: list):
+    """ A team's hypothetical cat margin (cats won - cats lost) against every opponent, per period """
+    results, teams, cats = aggregates(record).faceoff_tensor(period)
+    matchups = results[:, teams.index(team)]
+    margins = (matchups == 1).sum(axis=-1) - (matchups == -1).sum(axis=-1)
+    return pd.DataFrame(margins, index=pd.Index(period, name='period'), columns=teams).drop(columns=team)
+
+def _draw_faceoff(graph_df, team: str, period: list, path):
+    """ Draws a team's faceoff margins as a period x opponent heatmap and saves it to path """
+    fig, ax = plt.subplots(figsize=(12, 8))
+    sns.heatmap(graph_df.T, ax=ax, cmap='RdBu', center=0, vmin=-9, vmax=9, annot=True, cbar=False, linewidths=0.5)
+    ax.set(ylabel='', xlabel='Period')
+    plt.title(f'Faceoff Margins for {team} (Periods {period[0]} - {period[-1]})')
+    plt.tight_layout()
+    plt.savefig(path)
+
+def _render_init():
+    """ Process pool initializer; workers draw headless """
+    plt.switch_backend('Agg')
+
+def _render(job):
+    """ Runs one (draw function, args) job in a worker; returns the saved path and its render time """
+    draw, args = job
+    start = time.perf_counter()
+    draw(*args)
+    plt.close('all')
+    return str(args[-1]), time.perf_counter() - start
+
+def report(record, period: list, teams: list = None, workers: int = None):
+    """ Renders the snapshot, strength and faceoff charts of every team (or the given teams) to images/report/ in a process pool; returns {path: render seconds} """
+    
+    if len(period) < 2:
+        print('More than one period required')
+        return
+    
+    teams = teams or record.loc[record['period'] == period[-1]].index.to_list()
+    out_dir = Path(__file__).parent / "images/report"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    
+    #Compute every chart's data here (one shared aggregates pass); the workers only draw
+    agg = aggregates(record)
+    jobs = []
+    for team in teams:
+        jobs.append((_draw_snapshot, (_snapshot_frame(record, team, period), team, period, out_dir / f"snapshot_{team}.png")))
+        jobs.append((_draw_strengths, (_strength_frame(record, team, period), agg.team_totals(team, period)['min'], team, period, out_dir / f"strength_{team}.png")))
+        jobs.append((_draw_faceoff, (_faceoff_frame(record, team, period), team, period, out_dir / f"faceoff_{team}.png")))
+    
+    timings = {}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_render_init) as pool:
+        for path, seconds in pool.map(_render, jobs):
+            logger.info(f'Rendered {path} in {seconds:.2f}s')
+            timings[path] = seconds
+    logger.info(f'Rendered {len(timings)} charts for {len(teams)} teams in {time.perf_counter() - start:.2f}s')
+    
+    return timings
+
+
 
 if __name__ == "__main__":
     
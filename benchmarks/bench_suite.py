@@ -0,0 +1,147 @@
+""" Benchmark suite: times the parsing, roster and analytics hot paths on synthetic leagues of several sizes (offline).
+
+Run from the repo root: python benchmarks/bench_suite.py --scales small medium --repeat 3
+Results are written as JSON (benchmarks/results/ by default); pass --compare <older json> to print the change per benchmark.
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime
+from pathlib import Path
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import analytics
+import cbs
+import synthetic
+
+# name: (teams, players, periods)
+SCALES = {
+    "small": (10, 600, 8),
+    "medium": (12, 1500, 20),
+    "large": (20, 4000, 52),
+}
+
+
+def _timed(func, repeat: int, setup=None):
+    """ Wall times of repeat calls of func (setup runs untimed before each call) """
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def run_scale(scale: str, repeat: int, seed: int = 0) -> list:
+    """ Runs every benchmark on one synthetic league; returns the result rows """
+    teams, players, periods = SCALES[scale]
+    results = []
+
+    with tempfile.TemporaryDirectory() as root:
+        config_path = synthetic.write_league(root, teams, players, seed)
+        league = cbs.CBS(None, None, config_path, root=root)
+        league.punts = ["3pt", "ppg"]
+        record = synthetic.league_record(teams, periods, seed)
+        period = list(range(1, periods + 1))
+        team = record.index[0]
+
+        league_df = league._league_builder()
+        roster = league._roster_builder(Path(root) / "html/all_players.html")
+        zroster = roster.drop(columns=["salary", "position", "contract"])
+
+        # The analytics benchmarks start from an empty aggregates cache (the cost after an update)
+        benchmarks = {
+            "_roster_builder": (lambda: league._roster_builder(Path(root) / "html/all_players.html"), None),
+            "_additional_roster_filler": (lambda: league._additional_roster_filler(league_df, roster), None),
+            "_zroster_builder": (lambda: league._zroster_builder(zroster), None),
+            "faceoff": (lambda: analytics.faceoff(record, team, period), analytics.clear_aggregates),
+            "team_strengths(Prankings=True)": (lambda: analytics.team_strengths(record, team, period, Prankings=True), analytics.clear_aggregates),
+            "snapshot": (lambda: analytics.snapshot(record, team, period), analytics.clear_aggregates),
+        }
+
+        cwd = os.getcwd()
+        os.chdir(root)  # snapshot saves to images/ relative to the working directory
+        try:
+            for name, (func, setup) in benchmarks.items():
+                times = _timed(func, repeat, setup)
+                analytics.plt.close("all")
+                results.append({
+                    "scale": scale, "teams": teams, "players": players, "periods": periods, "benchmark": name,
+                    "best": min(times), "mean": float(np.mean(times)), "repeat": repeat,
+                })
+                print(f"{scale:>7} {name:<32} best {min(times):.4f}s  mean {np.mean(times):.4f}s")
+        finally:
+            os.chdir(cwd)
+            league.logger.removeHandler(league.file_handler)
+            league.file_handler.close()
+
+    return results
+
+
+def _commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).parent, capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def compare(results: list, previous_path):
+    """ Prints each benchmark's best time against an earlier results file """
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = {(x["scale"], x["benchmark"]): x["best"] for x in json.load(f)["results"]}
+    print(f"\nCompared with {previous_path}:")
+    for x in results:
+        before = previous.get((x["scale"], x["benchmark"]))
+        if before:
+            print(f"{x['scale']:>7} {x['benchmark']:<32} {before:.4f}s -> {x['best']:.4f}s  (x{before / x['best']:.2f})")
+
+
+def main(scales: list, repeat: int, output=None, previous=None):
+    warnings.filterwarnings("ignore")
+    results = []
+    for scale in scales:
+        results.extend(run_scale(scale, repeat))
+
+    output = Path(output) if output else Path(__file__).parent / f"results/bench-{datetime.now():%Y%m%d-%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as f:
+        json.dump({
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "results": results,
+        }, f, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if previous:
+        compare(results, previous)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", nargs="+", choices=list(SCALES), default=list(SCALES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="results json path (default: benchmarks/results/bench-<timestamp>.json)")
+    parser.add_argument("--compare", help="earlier results json to compare against")
+    args = parser.parse_args()
+    main(args.scales, args.repeat, args.output, args.compare)
@@ -0,0 +1,117 @@
+""" Benchmark: vectorized _zroster_builder vs the previous row-by-row builder on a synthetic player pool.
+
+Run from the repo root: python benchmarks/bench_zscores.py --players 1500
+"""
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import cbs
+
+CONFIG = {
+    "tracked_zcats": ["player_name", "g", "fgp", "ftp", "fgpg", "ftpg", "3ptpg", "rpg", "apg", "spg", "tpg", "bpg", "ppg", "team_id", "zrank"],
+    "league_total_budget": 2000,
+}
+PUNTS = ["3pt", "ppg"]
+
+
+def synthetic_roster(players: int, teams: int = 10, seed: int = 0):
+    """ Roster df shaped like _roster_builder's output (minus salary/position/contract) """
+    rng = np.random.default_rng(seed)
+    g = rng.integers(0, 82, players).astype(float)
+    roster = pd.DataFrame(
+        {
+            "team_id": rng.integers(0, teams + 1, players),
+            "g": g,
+            "fgp": rng.uniform(0.35, 0.65, players).round(3),
+            "ftp": rng.uniform(0.5, 0.95, players).round(3),
+            "fgpg": rng.uniform(0, 11, players).round(2),
+            "ftpg": rng.uniform(0, 8, players).round(2),
+            "3ptpg": rng.uniform(0, 4, players).round(2),
+            **{x: rng.uniform(0, 12, players).round(1) for x in ["rpg", "apg", "spg", "tpg", "bpg", "ppg"]},
+        },
+        index=pd.Index([f"Player {n}" for n in range(players)], name="player_name"),
+    )
+    return roster
+
+
+def reference_zroster(roster, draft=False):
+    """ The previous row-by-row implementation (iterrows + concat + row-wise apply), kept for comparison """
+    roster = roster.loc[roster['g'] > 0].copy()
+    exclusions = ["player_name", "g", "zrank", 'team_id']
+    data_refs = {}
+    for x in CONFIG["tracked_zcats"]:
+        if x not in exclusions:
+            data_refs.update({str(x + "-avg"): roster[x].mean()})
+            data_refs.update({str(x + "-stdev"): roster[x].std()})
+
+    roster["fg-impact"] = roster.apply(lambda row: (row.fgp - data_refs.get("fgp-avg")) * row.fgpg, axis=1).round(3)
+    roster["ft-impact"] = roster.apply(lambda row: (row.ftp - data_refs.get("ftp-avg")) * row.ftpg, axis=1).round(3)
+    data_refs["fg-impact-stdev"] = roster["fg-impact"].std()
+    data_refs["ft-impact-stdev"] = roster["ft-impact"].std()
+    data_refs["fg-impact-avg"] = roster["fg-impact"].mean()
+    data_refs["ft-impact-avg"] = roster["ft-impact"].mean()
+
+    z_df = pd.DataFrame(columns=CONFIG["tracked_zcats"])
+    for index, row in roster.iterrows():
+        new_entry = {
+            "player_name": [index],
+            "g": [row["g"]],
+            "fgpg": [round((((row["fgp"] - data_refs["fgp-avg"]) * row["fgpg"]) - data_refs["fg-impact-avg"]) / data_refs["fg-impact-stdev"], 3)],
+            "ftpg": [round((((row["ftp"] - data_refs["ftp-avg"]) * row["ftpg"]) - data_refs["ft-impact-avg"]) / data_refs["ft-impact-stdev"], 3)],
+            **{x: [round((row[x] - data_refs[f"{x}-avg"]) / data_refs[f"{x}-stdev"], 3)] for x in ["3ptpg", "rpg", "apg", "spg"]},
+            "tpg": [round(((row["tpg"] - data_refs["tpg-avg"]) / data_refs["tpg-stdev"]) * -1, 3)],
+            **{x: [round((row[x] - data_refs[f"{x}-avg"]) / data_refs[f"{x}-stdev"], 3)] for x in ["bpg", "ppg"]},
+            "team_id": [int(row["team_id"])],
+        }
+        z_df = pd.concat([pd.DataFrame.from_dict(new_entry), z_df])
+
+    cats = [x for x in CONFIG["tracked_zcats"] if x not in exclusions and x != "fgp" and x != "ftp"]
+    z_df["zrank"] = z_df.apply(lambda row: sum([row[x] for x in cats]), axis=1).round(3)
+    z_df["adj-zrank"] = z_df.apply(lambda row: sum([row[x] for x in cats if x not in PUNTS]), axis=1).round(3)
+    if draft:
+        z_df["draft"] = z_df.apply(lambda row: (row["zrank"] / z_df["zrank"].sum()) * CONFIG["league_total_budget"] * -1, axis=1).astype("int")
+        z_df["adj-draft"] = z_df.apply(lambda row: (row["adj-zrank"] / z_df["adj-zrank"].sum()) * CONFIG["league_total_budget"] * -1, axis=1).astype("int")
+    for x in ["zrank", "adj-zrank"]:
+        z_df[x] = round((z_df[x] - z_df[x].min()) / (z_df[x].max() - z_df[x].min()) * 100, 0).astype('int')
+    z_df["z-dif"] = z_df.apply(lambda row: (row["zrank"] - row["adj-zrank"]) * -1, axis=1).round(3)
+    if draft:
+        for x in ["draft", "adj-draft"]:
+            z_df[x] = round((z_df[x] - z_df[x].min()) / (z_df[x].max() - z_df[x].min()) * 65, 0).astype('int')
+    z_df = z_df.drop(columns=["fgp", "ftp"]).rename(columns={"fgpg": "fg", "ftpg": "ft", "3ptpg": "3p"})
+    z_df.set_index(["player_name"], inplace=True)
+    return z_df
+
+
+def main(players: int, draft: bool):
+    warnings.filterwarnings("ignore")
+    league = cbs.CBS.__new__(cbs.CBS)
+    league.config = CONFIG
+    league.punts = PUNTS
+    roster = synthetic_roster(players)
+
+    start = time.perf_counter()
+    reference = reference_zroster(roster, draft=draft)
+    reference_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = league._zroster_builder(roster, draft=draft)
+    vectorized_time = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(reference, vectorized, check_dtype=False, check_index_type=False)
+    print(f"{players} players (draft={draft}): row-by-row {reference_time:.3f}s, vectorized {vectorized_time:.4f}s, "
+          f"speedup x{reference_time / vectorized_time:.0f}; outputs match")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=1500)
+    parser.add_argument("--draft", action="store_true")
+    args = parser.parse_args()
+    main(args.players, args.draft)
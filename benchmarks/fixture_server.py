@@ -0,0 +1,184 @@
+""" Local stand-in for the CBS league site: serves recorded or synthetic league_home, standings, team, player and scoring pages, with optional latency and error injection.
+
+Run from the repo root: python benchmarks/fixture_server.py --root /tmp/league --port 8000 --latency 0.1 --error-rate 0.05
+then point the scraper at it: CBS(user, password, "/tmp/league/cbs-config.json", root="/tmp/league", base_url="http://127.0.0.1:8000").update()
+Pages are read from <root>/html/ (a recorded update or synthetic.write_league); scoring pages without a recorded html/scoring_{p}_{t}.html are generated.
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import regex as re
+
+import synthetic
+
+TEAM_PATH_REGEX = re.compile(r"^/teams/(\d+)/?$")
+SCORING_PATH_REGEX = re.compile(r"^/scoring/standard(?:/(\d+)/(\d+))?/?$")
+
+# config key -> recorded page
+CONFIG_PAGES = {
+    "league_home": "league_home",
+    "league_standings": "league_standings",
+    "league_allplayers_cy": "all_players",
+    "league_2022": "roster_2022",
+}
+
+
+class FixtureServer:
+    """ Threaded http server for a league folder; each request waits latency (+ up to jitter) seconds and fails with one of error_codes at error_rate """
+
+    def __init__(self, root, config_path=None, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, error_rate=0.0,
+                 error_codes=(500, 503), current_period=3, teams=10, seed=0):
+        self.root = Path(root)
+        config_path = Path(config_path) if config_path else self.root / "cbs-config.json"
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        self.routes = {urlsplit(config[key]).path.rstrip("/") or "/": page for key, page in CONFIG_PAGES.items() if key in config}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_codes = list(error_codes)
+        self.current_period = current_period
+        self.teams = teams
+        self.seed = seed
+        self.requests = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler())
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def page(self, path):
+        """ Html for a request path; None if the site has no such page """
+        path = path.rstrip("/") or "/"
+        if path in self.routes:
+            return self._read(self.routes[path])
+        team = TEAM_PATH_REGEX.match(path)
+        if team:
+            return self._read(f"team_{team.group(1)}")
+        scoring = SCORING_PATH_REGEX.match(path)
+        if scoring:
+            p, t = (int(x) for x in scoring.groups()) if scoring.group(1) else (self.current_period, 1)
+            if p > self.current_period or not 1 <= t <= self.teams // 2:
+                return None
+            return self._read(f"scoring_{p}_{t}") or synthetic.scoring_html(p, t, self.current_period, self.teams, self.seed)
+        return None
+
+    def _read(self, name):
+        path = self.root / f"html/{name}.html"
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+    def _fault(self):
+        """ Injected delay, then an error status (or None) """
+        with self._lock:
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            error = self._random.choice(self.error_codes) if self._random.random() < self.error_rate else None
+        if delay:
+            time.sleep(delay)
+        return error
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _send(self, status, body="", headers=None):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _respond(self, method):
+                path = urlsplit(self.path).path
+                if method == "POST":
+                    self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with server._lock:
+                    server.requests[(method, path)] += 1
+                error = server._fault()
+                if error is not None:
+                    return self._send(error, f"<html><body>Error {error}</body></html>", {"Retry-After": "1"} if error in (429, 503) else None)
+                if method == "POST":
+                    # Any form post (the login) succeeds and hands out a session cookie
+                    return self._send(200, "<html><body>Logged in</body></html>", {"Set-Cookie": "pid=fixture; Path=/"})
+                page = server.page(path)
+                if page is None:
+                    return self._send(404, "<html><body>Not found</body></html>")
+                # Conditional requests are answered like the real site: an unchanged page (same ETag) is a bodiless 304
+                etag = f'"{hashlib.sha256(page.encode("utf-8")).hexdigest()[:32]}"'
+                if self.headers.get("If-None-Match") == etag:
+                    return self._send(304, "", {"ETag": etag})
+                self._send(200, page, {"ETag": etag})
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """ Serves in a background thread; returns the base url """
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self.base_url
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", required=True, help="league folder (html/ and cbs-config.json); generated if it has no html/")
+    parser.add_argument("--teams", type=int, default=10)
+    parser.add_argument("--players", type=int, default=1500)
+    parser.add_argument("--period", type=int, default=3, help="current period")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra random seconds")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="share of requests answered with an error")
+    parser.add_argument("--error-codes", default="500,503", help="comma separated statuses to inject")
+    args = parser.parse_args()
+
+    if not (Path(args.root) / "html").exists():
+        synthetic.write_league(args.root, args.teams, args.players)
+
+    server = FixtureServer(args.root, host=args.host, port=args.port, latency=args.latency, jitter=args.jitter,
+                           error_rate=args.error_rate, error_codes=[int(x) for x in args.error_codes.split(",")],
+                           current_period=args.period, teams=args.teams)
+    print(f"Serving {args.root} at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
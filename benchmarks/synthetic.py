@@ -0,0 +1,179 @@
+""" Synthetic league generator: CBS-shaped html pages (all_players, team pages, standings, league home) and league_record frames of any size.
+
+The pages only carry the markup the parsers in cbs.py read, so the benchmarks run fully offline.
+"""
+import json
+from datetime import date, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CONFIG = {
+    "login_info": {},
+    "login_url": "https://www.cbssports.com/login",
+    "league_home": "https://forkeeps.basketball.cbssports.com/",
+    "league_standings": "https://forkeeps.basketball.cbssports.com/standings/overall",
+    "league_allplayers_cy": "https://forkeeps.basketball.cbssports.com/stats/stats-main/all:C:F:G/ytd:f/standard/stats",
+    "league_2022": "https://forkeeps.basketball.cbssports.com/stats/stats-main/all:C:F:G/2022:f/standard/stats",
+    "league_period": 1,
+    "tracked_datapoints": ["team_name", "team_id", "manager", "record"],
+    "tracked_statcats": ["player_name", "team_id", "salary", "contract", "position", "g", "mpg", "fg", "fgp", "ft", "ftp",
+                         "3pt", "3ptp", "rpg", "apg", "spg", "tpg", "bpg", "ppg", "cbs_rank"],
+    "tracked_zcats": ["player_name", "g", "fgp", "ftp", "fgpg", "ftpg", "3ptpg", "rpg", "apg", "spg", "tpg", "bpg", "ppg", "team_id", "zrank"],
+}
+ROSTER_SIZE = 13
+POSITIONS = ["G", "F", "C", "G,F", "F,C"]
+SEASON_START = date(2025, 10, 20)
+
+
+def team_names(teams: int) -> list:
+    return [f"Team {n}" for n in range(1, teams + 1)]
+
+
+def assignments(teams: int, players: int, seed: int = 0):
+    """ team_id of every player (0 = free agent); each team gets up to ROSTER_SIZE players """
+    rng = np.random.default_rng(seed)
+    team_ids = np.zeros(players, dtype=int)
+    rostered = rng.choice(players, size=min(players, teams * ROSTER_SIZE), replace=False)
+    team_ids[rostered] = np.arange(len(rostered)) % teams + 1
+    return team_ids
+
+
+def all_players_html(team_ids, seed: int = 0) -> str:
+    """ The all players stats page (sortableStats table, one player per line) """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n, team_id in enumerate(team_ids):
+        g = int(rng.integers(0, 70))
+        stats = [g, round(rng.uniform(5, 38), 1), int(rng.integers(0, 700)), round(rng.uniform(.35, .65), 3), int(rng.integers(0, 500)),
+                 round(rng.uniform(.5, .95), 3), int(rng.integers(0, 250)), round(rng.uniform(.2, .45), 3)]
+        stats += [round(rng.uniform(0, 12), 1) for _ in range(6)] + [n + 1]
+        team = f' <a href="/teams/{team_id}">T{team_id}</a>' if team_id else ""
+        cells = "".join(f'<td align="right">{x}</td>' for x in stats)
+        rows.append(f'<tr class="row{n % 2}"><td><a href="/players/playerpage/{1000000 + n}/player-{n}">Player {n}</a>{team}</td>{cells}</tr>')
+    return (
+        '<html><body><div id="header"><a href="/players/playerpage/99999/news">News</a></div>\n'
+        '<div class="data" id="sortableStats"><div class="tableHeader"></div><table>\n<tr class="label"><td>Player</td></tr>\n'
+        + "\n".join(rows)
+        + "\n</table></div>\n<div id=\"footer\"></div></body></html>"
+    )
+
+
+def team_page_html(team_id: int, team_ids, seed: int = 0) -> str:
+    """ A team page (lineup_views: player links, positions, salary/contract cells and weekly home/away games) """
+    rng = np.random.default_rng(seed + team_id)
+    rows = []
+    for n in np.flatnonzero(np.asarray(team_ids) == team_id):
+        rows.append(
+            f'<tr class="playerRow"><td><a aria-label=" Player {n} " class="playerLink" href="/players/playerpage/{1000000 + n}/player-{n}">Player {n}</a>'
+            f' <span class="playerPositionAndTeam"> {POSITIONS[n % len(POSITIONS)]} </span></td>'
+            f'<td align="right">{int(rng.integers(1, 60))}</td><td align="right">{"AB"[n % 2]}</td>'
+            f'<td class="games">Home: {int(rng.integers(0, 3))} Away: {int(rng.integers(0, 3))}</td></tr>'
+        )
+    return (
+        f'<html><body><div id="header">Team {team_id}</div>\n<div id="lineup_views"><table>\n'
+        + "\n".join(rows)
+        + "\n</table></div>\n</body></html>"
+    )
+
+
+def standings_html(teams: int) -> str:
+    """ The standings page with its FantasyGlobalChatJson team blob """
+    blob = {
+        "league": {"name": "Synthetic League"},
+        "teams": [
+            {"team": {"id": str(n), "name": name, "long_abbr": f"Manager {n}", "logo": f"https://example.invalid/logo_{n}.png"}}
+            for n, name in enumerate(team_names(teams), start=1)
+        ],
+    }
+    return f"<html><body><script>var FantasyGlobalChatJson = {json.dumps(blob)};</script>\n<div id=\"standings\"></div></body></html>"
+
+
+def league_home_html(teams: int, seed: int = 0) -> str:
+    """ The league home page (hpfcLeagueStandings table: team links and W-L-T records) """
+    rng = np.random.default_rng(seed)
+    rows = []
+    for n, name in enumerate(team_names(teams), start=1):
+        w, l = (int(x) for x in rng.integers(0, 20, 2))
+        rows.append(f'<tr><td><a href="/teams/{n}"><span class="tooltip" title="{name}">{name[:8]}</span></a></td><td align="right">{w}-{l}-0</td></tr>')
+    return '<html><body><div id="hpfcLeagueStandings"><table>\n' + "\n".join(rows) + "\n</table></div></body></html>"
+
+
+def period_label(period: int) -> str:
+    """ The scoring page's period selector label, e.g. 'PERIOD 3 (Mon, Nov 3 - Sun, Nov 9)' """
+    start = SEASON_START + timedelta(weeks=period - 1)
+    end = start + timedelta(days=6)
+    return f"PERIOD {period} ({start:%a}, {start:%b} {start.day} - {end:%a}, {end:%b} {end.day})"
+
+
+def scoring_html(period: int, matchup: int, current_period: int, teams: int = 10, seed: int = 0) -> str:
+    """ A scoring/standard/{period}/{matchup} page: both teams' names, W-L-T scores and the 11 cat totals """
+    rng = np.random.default_rng([seed, period, matchup])
+    names = team_names(teams)
+    home, away = names[(2 * matchup - 2) % teams], names[(2 * matchup - 1) % teams]
+
+    def __cats(side):
+        values = [rng.integers(40, 120), rng.integers(100, 300), rng.integers(20, 70), round(rng.uniform(.43, .50), 3),
+                  round(rng.uniform(.70, .85), 3), rng.integers(20, 40), rng.integers(900, 1400), rng.integers(500, 1300),
+                  rng.integers(30, 80), rng.integers(60, 160), rng.integers(200, 500)]
+        return "".join(f'<td id="{side}ocats{n}">{x}</td>' for n, x in enumerate(values))
+
+    w, l = (int(x) for x in rng.integers(0, 10, 2))
+    return (
+        f'<html><body><div class="select_div_label_container">{period_label(current_period)}</div>\n'
+        f'<div id="T_CAT_topSBHOME">{home}</div><div id="T_CAT_topSBAWAY">{away}</div>\n'
+        f'<div id="home_big_score">{w}-{l}-0</div><div id="away_big_score">{l}-{w}-0</div>\n'
+        f'<table><tr>{__cats("home")}</tr>\n<tr>{__cats("away")}</tr></table></body></html>'
+    )
+
+
+def league_record(teams: int, periods: int, seed: int = 0):
+    """ A league_record frame: one row per (period, team) with the weekly cat totals """
+    rng = np.random.default_rng(seed)
+    names = team_names(teams)
+    rows = []
+    for p in range(1, periods + 1):
+        opponents = rng.permutation(names)
+        for team, opponent in zip(names, opponents):
+            rows.append({
+                "period": p,
+                "team": team,
+                "opponent": str(opponent),
+                "score": f"{rng.integers(0, 10)}-{rng.integers(0, 10)}-{rng.integers(0, 3)}",
+                "3pt": float(rng.integers(40, 120)),
+                "ast": float(rng.integers(100, 300)),
+                "bk": float(rng.integers(20, 70)),
+                "fgp": round(float(rng.uniform(.43, .50)), 3),
+                "ftp": round(float(rng.uniform(.70, .85)), 3),
+                "g": int(rng.integers(20, 40)),
+                "min": float(rng.integers(900, 1400)),
+                "pts": float(rng.integers(500, 1300)),
+                "st": float(rng.integers(30, 80)),
+                "to": float(rng.integers(60, 160)),
+                "trb": float(rng.integers(200, 500)),
+            })
+    return pd.DataFrame(rows).set_index("team")
+
+
+def write_league(root, teams: int, players: int, seed: int = 0):
+    """ Writes a synthetic league's html pages, config and empty data folders under root; returns the config path """
+    root = Path(root)
+    for folder in ["html", "pickle", "parquet", "logs", "images"]:
+        (root / folder).mkdir(parents=True, exist_ok=True)
+    (root / "pickle/cbs_cookies.json").write_text("[]", encoding="utf-8")  # Saved (empty) login; no browser login against the fixture server
+
+    team_ids = assignments(teams, players, seed)
+    pages = {
+        "all_players": all_players_html(team_ids, seed),
+        "roster_2022": all_players_html(team_ids, seed + 1),
+        "league_standings": standings_html(teams),
+        "league_home": league_home_html(teams, seed),
+        **{f"team_{n}": team_page_html(n, team_ids, seed) for n in range(1, teams + 1)},
+    }
+    for name, page in pages.items():
+        (root / f"html/{name}.html").write_text(page, encoding="utf-8")
+
+    config_path = root / "cbs-config.json"
+    config_path.write_text(json.dumps({**CONFIG, "league_teams": teams}), encoding="utf-8")
+    return config_path
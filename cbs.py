@@ -3,30 +3,487 @@ import os
 from os.path import exists
 import sys
 import time
-import requests
+import random
+import queue
+import shutil
+import importlib
 import pandas as pd
+import numpy as np
 import json
+import html
+import hashlib
 import logging
+import threading
+import tracemalloc
+import cProfile
+import pstats
+import io
+import gzip
+from contextlib import contextmanager
 from pathlib import Path
-from datetime import datetime
-from bs4 import BeautifulSoup as bs
-
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.by import By
-
+from urllib.parse import urlsplit
+from functools import cached_property
+from itertools import combinations
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+from typing import NamedTuple
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Columnar storage is optional; frames are pickled without pyarrow
+    pa = None
+
+try:
+    import zstandard
+except ImportError:  # Archived pages are gzipped without zstandard
+    zstandard = None
+
+
+
+class LazyModule:
+    """ Stand-in for a module that is only imported on first attribute access (keeps cold starts cheap) """
+
+    def __init__(self, name: str):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+# Only needed when scraping/parsing html
+requests = LazyModule("requests")
+bs4 = LazyModule("bs4")
+
+# Compiled once; used by the roster parser on every player row
+PLAYER_NAME_REGEX = re.compile(r'(?<=playerpage/\d{4,9}.*">)(.*?)(?=</a>)')
+PLAYER_TEAM_REGEX = re.compile(r'(?<=<a href="/teams/)(.*?)(?=">)')
+PLAYER_STATS_REGEX = re.compile(r'(?<=<td align="right")([\s\S]*?)(?=</tr>)')
+STAT_VALUE_REGEX = re.compile(r"(?<=>)([0-9.]+)(?=<)")
+DIV_TAG_REGEX = re.compile(r"<(/?)div\b[^>]*>", re.IGNORECASE)
+
+# Compiled once; used by the team page parser
+LINEUP_PLAYER_REGEX = re.compile(r'(?<=aria-label=" ).*?(?= " class="playerLink")')
+LINEUP_POSITION_REGEX = re.compile(r"(?<=\s)[FGC,]+(?=\s|\s)")
+LINEUP_SALARY_REGEX = re.compile(r'<td align="right">(\d+)<\/td><td align="right">([A-Z])<\/td>')
+LINEUP_HOME_REGEX = re.compile(r"(?:Home: )(\d+)")
+LINEUP_AWAY_REGEX = re.compile(r"(?:Away: )(\d+)")
+NON_TEXT_REGEX = re.compile(r"<!--[\s\S]*?-->|<(script|style)\b[\s\S]*?</\1>", re.IGNORECASE)
+TAG_REGEX = re.compile(r"<[^>]*>")
+
+# Z-score categories weighted by a percentage (per-game makes -> pct), and categories where lower is better
+ZCAT_IMPACT = {"fgpg": "fgp", "ftpg": "ftp"}
+ZCAT_NEGATIVE = ["tpg"]
+ZCAT_RENAMES = {"fgpg": "fg", "ftpg": "ft", "3ptpg": "3p"}
+
+
+def _div_html(page: str, div_id: str) -> str:
+    """ Returns the raw html of the div with the given id (matching nested divs in one scan); empty string if absent """
+    start = re.search(fr'<div\b[^>]*\bid="{div_id}"[^>]*>', page)
+    if start is None:
+        return ""
+    depth = 0
+    for tag in DIV_TAG_REGEX.finditer(page, start.start()):
+        depth += -1 if tag.group(1) else 1
+        if depth == 0:
+            return page[start.start():tag.end()]
+    return page[start.start():]
+
+
+def _html_text(fragment: str) -> str:
+    """ Text content of an html fragment (tags, comments and scripts dropped, entities decoded), like BeautifulSoup's .text """
+    return html.unescape(TAG_REGEX.sub("", NON_TEXT_REGEX.sub("", fragment)))
+
+
+def _column_sum(df, columns: list):
+    """ Row totals of the given columns, added left to right (same float result as a per-row sum()) """
+    total = np.zeros(len(df))
+    for x in columns:
+        total = total + df[x].to_numpy(dtype=float)
+    return pd.Series(total, index=df.index)
+
+
+def _min_max(values):
+    """ Column-wise min-max scaling of a 2d array """
+    low = values.min(axis=0)
+    return (values - low) / (values.max(axis=0) - low)
+
+
+def _auction_values(totals, rostered: int, budget):
+    """ $ values of zrank totals (players, or players x punt sets) above replacement level: the best total left once `rostered` players are taken; players at or below it get 0 """
+    totals = np.asarray(totals, dtype=float)
+    ranked = -np.sort(-totals, axis=0)
+    surplus = np.clip(totals - ranked[min(rostered, len(ranked) - 1)], 0, None)
+    pool = surplus.sum(axis=0)
+    return np.trunc(surplus / np.where(pool > 0, pool, 1) * budget)
+
+
+class TeamRecord(NamedTuple):
+    """ A team as listed in the standings page's embedded json """
+    team_id: str
+    name: str
+    manager: str
+    logo_url: str
+
+
+# League site; CBS(base_url=...) points every request (config urls and logins included) at another host, e.g. a local fixture server
+DEFAULT_BASE_URL = "https://forkeeps.basketball.cbssports.com"
+LOGIN_URL = "https://www.cbssports.com/user/login/?redirectUrl=https%3A%2F%2Fwww.cbssports.com%2F%3Flogin%3Dconfirmed"
+
+# Stored frames: CBS attribute -> legacy pickle name
+FRAME_PICKLES = {
+    "league_df": "pickled_league_df",
+    "roster_current": "pickled_roster_df",
+    "roster_2022": "pickled_roster_2022",
+    "zscores": "pickled_zscores",
+    "league_record": "pickled_record",
+}
+
+# Compact dtypes for the stored frames: labels repeated on every row are categoricals, stats float32 (where that is lossless) and league_record
+# counts small ints; the raw 'W-L-T' score is kept (as a categorical) next to its parsed wins/losses/ties
+CATEGORY_COLUMNS = ["team", "opponent", "score", "contract", "position"]
+RECORD_INT_COLUMNS = {"period": "int16", "g": "int16", "wins": "Int8", "losses": "Int8", "ties": "Int8"}
+SCORE_REGEX = r"^\s*(\d+)-(\d+)-(\d+)\s*$"
+
+
+def _float32_safe(values) -> bool:
+    """ True if float64 values survive a float32 round trip unchanged (counts do; percentages and zscores like 0.456 don't) """
+    values = values.to_numpy()
+    return bool(np.array_equal(values.astype("float32").astype("float64"), values, equal_nan=True))
+
+
+def _compact_frame(name, df):
+    """ df with the compact dtypes; league_record gets wins/losses/ties parsed from its score (NA where the score isn't W-L-T). Compact frames come back as they are """
+    if name == "league_df":
+        return df
+    if name == "league_record":
+        if "score" in df.columns and "wins" not in df.columns:
+            wlt = df["score"].astype(str).str.extract(SCORE_REGEX)
+            position = df.columns.get_loc("score") + 1
+            df = df.copy()
+            for n, x in enumerate(["wins", "losses", "ties"]):
+                df.insert(position + n, x, pd.to_numeric(wlt[n]).to_numpy())
+        df = df.astype({x: y for x, y in RECORD_INT_COLUMNS.items() if x in df.columns})
+    df = df.astype({
+        **{x: "float32" for x in df.columns if df[x].dtype == "float64" and _float32_safe(df[x])},
+        **{x: "category" for x in CATEGORY_COLUMNS if x in df.columns and not isinstance(df[x].dtype, pd.CategoricalDtype)},
+    })
+    if df.index.name in CATEGORY_COLUMNS and not isinstance(df.index.dtype, pd.CategoricalDtype):
+        df = df.set_axis(df.index.astype("category"))
+    return df
+
+
+# Callbacks run after every CBS.update() (e.g. analytics clearing its caches)
+UPDATE_HOOKS = []
+
+
+def register_update_hook(hook):
+    """ Registers a no-argument callable to run after every CBS.update() """
+    if hook not in UPDATE_HOOKS:
+        UPDATE_HOOKS.append(hook)
+    return hook
+
+
+def _compress(data: bytes):
+    """ (codec, compressed bytes): zstd when zstandard is installed, else gzip """
+    if zstandard is not None:
+        return "zst", zstandard.ZstdCompressor(level=10).compress(data)
+    return "gz", gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zst":
+        return zstandard.ZstdDecompressor().decompress(data)
+    return gzip.decompress(data)
+
+
+@contextmanager
+def _atomic_path(path):
+    """ Yields a temp path next to path that replaces path once the block succeeds (readers never see a half-written file) """
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        yield tmp_path
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.is_dir():
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        elif exists(tmp_path):
+            tmp_path.unlink()
+
+
+def _atomic_write(path, data, mode=None):
+    """ Writes bytes (or str, as utf-8) to path through a temp file and a rename; mode (e.g. 0o600) is set before any data is written """
+    with _atomic_path(path) as tmp_path:
+        if mode is not None:
+            tmp_path.touch(mode=mode)
+        tmp_path.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+
+
+def _retry_after(value):
+    """ Seconds requested by a Retry-After header (delta seconds or an http date); None if absent or unreadable """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+class RequestScheduler:
+    """ Paces and retries all CBS traffic: a token bucket (rate requests per second, bursts of up to burst), a timeout per request,
+    and jittered exponential backoff on timeouts, dropped connections, 429 and 5xx; a Retry-After pauses every worker, not just the one throttled """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, rate=5.0, burst=8, timeout=(10, 30), retries=4, backoff=0.5, max_backoff=30.0, logger=None):
+        self.rate = rate
+        self.burst = burst
+        self.timeout = timeout  # (connect, read) seconds
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.logger = logger or logging.getLogger(__name__)
+        self.retried = 0
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def acquire(self):
+        """ Blocks until the bucket has a token (and any Retry-After pause is over), then takes it """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._refilled) * self.rate)
+                self._refilled = now
+                wait = self._paused_until - now
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def _delay(self, attempt, retry_after=None):
+        """ Full-jitter exponential backoff; a Retry-After (when longer) is honoured and pauses the whole bucket """
+        delay = self._random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        if retry_after is not None and retry_after > delay:
+            delay = min(retry_after, self.max_backoff)
+            with self._lock:
+                self._paused_until = max(self._paused_until, time.monotonic() + delay)
+        with self._lock:
+            self.retried += 1
+        return delay
+
+    def request(self, s, method, url, **kwargs):
+        """ s.request(method, url) paced by the bucket and retried; returns the last response (callers check its status) """
+        kwargs.setdefault("timeout", self.timeout)
+        for attempt in range(0, self.retries + 1):
+            self.acquire()
+            try:
+                response = s.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                if attempt == self.retries:
+                    raise
+                delay = self._delay(attempt)
+                self.logger.warning(f"{method} {url}: {type(e).__name__}; retry {attempt + 1}/{self.retries} in {delay:.2f}s")
+            else:
+                if response.status_code not in self.RETRY_STATUSES or attempt == self.retries:
+                    return response
+                delay = self._delay(attempt, _retry_after(response.headers.get("Retry-After")))
+                self.logger.warning(f"{method} {url}: HTTP {response.status_code}; retry {attempt + 1}/{self.retries} in {delay:.2f}s")
+                response.close()
+            time.sleep(delay)
+
+    def get(self, s, url, **kwargs):
+        return self.request(s, "GET", url, **kwargs)
+
+    def post(self, s, url, **kwargs):
+        return self.request(s, "POST", url, **kwargs)
+
+    def call(self, func, *args, retry_on=(), **kwargs):
+        """ Runs func (e.g. a selenium page load and its waits) paced by the bucket, retrying on the retry_on exceptions """
+        for attempt in range(0, self.retries + 1):
+            self.acquire()
+            try:
+                return func(*args, **kwargs)
+            except retry_on as e:
+                if attempt == self.retries:
+                    raise
+                delay = self._delay(attempt)
+                self.logger.warning(f"{getattr(func, '__name__', func)}: {type(e).__name__}; retry {attempt + 1}/{self.retries} in {delay:.2f}s")
+            time.sleep(delay)
+
+
+def _trigrams(text: str) -> set:
+    return {text[n:n + 3] for n in range(0, len(text) - 2)}
+
+
+class NameIndex:
+    """ Trigram index over a list of names; substring lookups only check names sharing every trigram of the query """
+
+    def __init__(self, names: list):
+        self.names = [str(x) for x in names]
+        self.grams = defaultdict(set)
+        for n, name in enumerate(self.names):
+            for gram in _trigrams(name.lower()):
+                self.grams[gram].add(n)
+
+    def contains(self, query: str) -> list:
+        """ Names containing query (case-sensitive, in original order), same result as scanning with `query in name` """
+        grams = _trigrams(query.lower())
+        if grams:
+            postings = sorted((self.grams.get(x, set()) for x in grams), key=len)
+            candidates = sorted(set.intersection(*postings))
+        else:
+            candidates = range(0, len(self.names))
+        return [self.names[n] for n in candidates if query in self.names[n]]
+
+    def fuzzy(self, query: str, limit=5, cutoff=0.6) -> list:
+        """ Closest names to query; candidates are shortlisted by shared trigrams, then scored with difflib """
+        query = query.lower()
+        shared = Counter(n for x in _trigrams(query) for n in self.grams.get(x, ()))
+        shortlist = [n for n, _ in shared.most_common(limit * 10)] or range(0, len(self.names))
+        scored = sorted(
+            ((SequenceMatcher(None, query, self.names[n].lower()).ratio(), self.names[n]) for n in shortlist),
+            reverse=True,
+        )
+        return [name for score, name in scored[:limit] if score >= cutoff]
+
+
+class UpdateMetrics:
+    """ Timing spans of one update() run (stages, pages, parsers) with bytes fetched and rows parsed; logged as they finish and saved as json """
+
+    def __init__(self, logger, profile=False):
+        self.logger = logger
+        self.profile = profile
+        self._local = threading.local()  # current stage per thread (stages run concurrently)
+        self.spans = []
+        self.started = datetime.now()
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+        self._profilers = []  # One cProfile.Profile per thread (a profiler only sees the thread that enabled it)
+
+    @contextmanager
+    def span(self, name, kind="parse", **fields):
+        """ Times the block; the yielded dict takes extra fields (e.g. span["bytes"], span["rows"]). Spans belong to the calling thread's stage unless stage= is passed """
+        entry = {"name": name, "kind": kind, "stage": getattr(self._local, "stage", None), **fields}
+        if kind == "stage":
+            self._local.stage = entry["stage"] = name
+            if tracemalloc.is_tracing():
+                tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            yield entry
+        finally:
+            entry["seconds"] = round(time.perf_counter() - start, 4)
+            if kind == "stage" and tracemalloc.is_tracing():
+                entry["peak_bytes"] = tracemalloc.get_traced_memory()[1]
+            with self._lock:
+                self.spans.append(entry)
+            details = "".join(f", {x}={entry[x]}" for x in ["bytes", "rows", "status"] if x in entry)
+            self.logger.info(f"[{kind}] {name}: {entry['seconds']:.3f}s{details}")
+
+    def _thread_profiler(self, *args):
+        """ Profiles the calling thread from here on (threading.setprofile hook: runs once per new thread, then cProfile takes over) """
+        sys.setprofile(None)
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            return  # Python 3.12+: cProfile is process-wide, so the calling thread's profiler already sees this thread
+        with self._lock:
+            self._profilers.append(profiler)
+
+    def start(self):
+        """ Starts tracemalloc and cProfile (the calling thread and every thread started until finish(), e.g. the stage and worker pools) when profiling """
+        if self.profile:
+            tracemalloc.start()
+            self._thread_profiler()
+            threading.setprofile(self._thread_profiler)
+
+    def summary(self):
+        """ Per stage: seconds, pages, bytes fetched and rows parsed """
+        stages = {}
+        for x in self.spans:
+            if x["stage"] is None:
+                continue
+            stage = stages.setdefault(x["stage"], {"seconds": 0, "pages": 0, "bytes": 0, "rows": 0})
+            if x["kind"] == "stage":
+                stage["seconds"] = x["seconds"]
+                if "peak_bytes" in x:
+                    stage["peak_bytes"] = x["peak_bytes"]
+            stage["pages"] += x["kind"] in ("page", "scoring")
+            stage["bytes"] += x.get("bytes", 0)
+            stage["rows"] += x.get("rows", 0)
+        return stages
+
+    def finish(self, path):
+        """ Stops profiling, logs the slowest pages and stage regressions against the previous run, and saves the metrics to path """
+        output = {
+            "started": self.started.isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - self._start, 4),
+            "stages": self.summary(),
+            "spans": self.spans,
+        }
+
+        if self._profilers:
+            threading.setprofile(None)
+            self._profilers[0].disable()  # The calling thread's; the pool threads have exited
+            profile_path = Path(path).with_suffix(".prof")
+            stats_text = io.StringIO()
+            stats = pstats.Stats(*self._profilers, stream=stats_text)
+            stats.dump_stats(profile_path)
+            stats.sort_stats("cumulative").print_stats(25)
+            self.logger.info(f"Profile (top 25 cumulative, saved to {profile_path}):\n{stats_text.getvalue()}")
+            output["profile"] = str(profile_path)
+        if self.profile and tracemalloc.is_tracing():
+            output["allocations"] = [
+                {"where": str(x.traceback), "bytes": x.size, "count": x.count}
+                for x in tracemalloc.take_snapshot().statistics("lineno")[:15]
+            ]
+            tracemalloc.stop()
+
+        pages = sorted((x for x in self.spans if x["kind"] in ("page", "scoring")), key=lambda x: x["seconds"], reverse=True)
+        for x in pages[:5]:
+            self.logger.info(f"Slow page: {x['name']} {x['seconds']:.3f}s")
+
+        if exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f).get("stages", {})
+            for name, stage in output["stages"].items():
+                before = previous.get(name, {}).get("seconds")
+                if before and stage["seconds"] > 1.5 * before and stage["seconds"] - before > 1:
+                    self.logger.warning(f"Stage {name} took {stage['seconds']:.2f}s (previous run {before:.2f}s)")
+
+        _atomic_write(path, json.dumps(output, indent=4))
+        return output
 
 
 class CBS:
     
     """Class to maintain and update pool data; update results via .update() function. Used in conjunction with analytics.py, which contains various analysis/visualization functions"""
     
-    def __init__(self, cbs_user:str, cbs_pass:str, c_path:str):
+    def __init__(self, cbs_user:str, cbs_pass:str, c_path:str, root=None, base_url=None):
+
+        # Data directory (html/, pickle/, parquet/, logs/); defaults to the repo folder
+        self.root = Path(root) if root is not None else Path(__file__).parent
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self._base_override = base_url is not None
 
         # Logging (output to file)
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.DEBUG)
-        log_path = Path(__file__).parent / "logs/commentscrape.log"
+        log_path = self.root / "logs/commentscrape.log"
         self.file_handler = logging.FileHandler(log_path, encoding="utf-8", mode="w")
         self.file_format = logging.Formatter(
             "%(asctime)s, %(msecs)03d %(levelname)-8s [%(filename)s:%(lineno)d] %(message)s"
@@ -43,469 +500,887 @@ class CBS:
         self.config["league_total_budget"] = 2000
         self.c_path = c_path
         
-        # LOAD FROM HTML FILES
-        if exists(Path(__file__).parent / "html/league_home.html"):
-            path = Path(__file__).parent / "html/league_home.html"
-            with path.open("r", encoding="utf-8") as f:
-                self.souped_league_home = bs(f, "html.parser")
-        else: self.update()
-
-        if exists(Path(__file__).parent / "html/league_standings.html"):
-            path = Path(__file__).parent / "html/league_standings.html"
-            with path.open("r", encoding="utf-8") as f:
-                self.souped_league_standings = bs(f, "html.parser")
-        else: self.update()
-
-        if exists(Path(__file__).parent / "html/all_players.html"):
-            path = Path(__file__).parent / "html/all_players.html"
-            with path.open("r", encoding="utf-8") as f:
-                self.souped_allplayers = bs(f, "html.parser")
-        else: self.update()
-
-        # LOAD FROM DF FILES
-        if exists(Path(__file__).parent / "pickle/pickled_league_df.pkl"):
-            self.league_df = pd.read_pickle(
-                Path(__file__).parent / "pickle/pickled_league_df.pkl"
-            )
-        else: self.update()
-
-        if exists(Path(__file__).parent / "pickle/pickled_roster_df.pkl"):
-            self.roster_current = pd.read_pickle(
-                Path(__file__).parent / "pickle/pickled_roster_df.pkl"
-            )
-        else: self.update()
-
-        if exists(Path(__file__).parent / "pickle/pickled_roster_2022.pkl"):
-            self.roster_2022 = pd.read_pickle(
-                Path(__file__).parent / "pickle/pickled_roster_2022.pkl"
-            )
-        else: self.update()
-
-        if exists(Path(__file__).parent / "pickle/pickled_zscores.pkl"):
-            self.zscores = pd.read_pickle(
-                Path(__file__).parent / "pickle/pickled_zscores.pkl"
-            )
-        else: self.update()
-        
-        if exists(Path(__file__).parent / "pickle/pickled_record.pkl"):
-            self.league_record = pd.read_pickle(
-                Path(__file__).parent / "pickle/pickled_record.pkl"
-            )
-        else: self.update()
-        
+        # Html/df state is loaded lazily on first access (see the properties below)
+        self._updating = False
+        self._auto_updated = False
+        self._punt_tables = {}
+        self.metrics = None
+        self._replay_pages = None
+        self._staged_pages = {}
+        self.scheduler = RequestScheduler(logger=self.logger)
         
+    def _url(self, url):
+        """ Absolute url of a league page (paths are joined to base_url; with a base_url override, full urls keep only their path and query) """
+        parts = urlsplit(url)
+        if parts.scheme and not self._base_override:
+            return url
+        return f"{self.base_url}/{parts.path.lstrip('/')}" + (f"?{parts.query}" if parts.query else "")
+
+    def _artifact(self, relative_path):
+        """ Path to a local html/pickle artifact; the first missing one triggers a single combined update() """
+        path = self.root / relative_path
+        if not exists(path) and not self._updating and not self._auto_updated:
+            self.logger.info(f"{relative_path} missing; running update()")
+            self._auto_updated = True
+            self.update()
+        return path
+
+    def _invalidate(self, *attrs):
+        """ Drops cached lazy attributes so they are reloaded on next access """
+        for attr in attrs:
+            self.__dict__.pop(attr, None)
+
+    # FRAME STORAGE (parquet when pyarrow is installed, pickles otherwise)
+    def _frame_path(self, name, backend):
+        if backend == "parquet":
+            return self.root / ("parquet/league_record" if name == "league_record" else f"parquet/{name}.parquet")
+        return self.root / f"pickle/{FRAME_PICKLES[name]}.pkl"
+
+    def _frame_exists(self, name):
+        return (pa is not None and exists(self._frame_path(name, "parquet"))) or exists(self._frame_path(name, "pickle"))
+
+    def store_frame(self, name, df, periods=None):
+        """ Writes a frame to columnar storage (compact dtypes); league_record is partitioned by period and only `periods` are rewritten when given """
+        df = _compact_frame(name, df)
+        if pa is not None:
+            path = self._frame_path(name, "parquet")
+            path.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if name == "league_record":
+                    full = periods is None
+                    if full:
+                        periods = sorted(set(df['period'].astype(int)))
+                    rows = df.loc[df['period'].astype(int).isin(periods)].reset_index()
+                    # Partitions are written to a staging folder (ignored by readers), then swapped in by renames
+                    staging = path / f"_staging.{os.getpid()}.{threading.get_ident()}"
+                    try:
+                        pq.write_to_dataset(pa.Table.from_pandas(rows, preserve_index=False), root_path=str(staging), partition_cols=["period"])
+                        replaced = {path / f"period={p}" for p in periods} | (set(path.glob("period=*")) if full else set())
+                        for partition in replaced:
+                            if exists(partition):
+                                os.replace(partition, staging / f"_old.{partition.name}")
+                        for partition in staging.glob("period=*"):
+                            os.replace(partition, path / partition.name)
+                    finally:
+                        shutil.rmtree(staging, ignore_errors=True)
+                else:
+                    with _atomic_path(path) as tmp_path:
+                        df.to_parquet(tmp_path)
+                return
+            except (pa.ArrowException, TypeError, ValueError) as e:
+                self.logger.warning(f"{name}: parquet write failed ({e}); storing a pickle instead")
+                if path.is_dir():
+                    shutil.rmtree(path, ignore_errors=True)
+                elif exists(path):
+                    path.unlink()
+
+        with _atomic_path(self._frame_path(name, "pickle")) as tmp_path:
+            df.to_pickle(tmp_path)
+
+    def load_frame(self, name, columns=None, periods=None):
+        """ Reads a stored frame (compact dtypes, older frames are converted on load); parquet reads are memory-mapped and limited to `columns` (and, for league_record, `periods`) """
+        if not self._frame_exists(name):
+            self._artifact(f"pickle/{FRAME_PICKLES[name]}.pkl")  # Triggers the combined update()
+
+        parquet_path = self._frame_path(name, "parquet")
+        pickle_path = self._frame_path(name, "pickle")
+        if pa is not None and not exists(parquet_path) and exists(pickle_path):
+            self.migrate_pickles(name)
+
+        if pa is None or not exists(parquet_path):
+            df = _compact_frame(name, pd.read_pickle(pickle_path))
+            if periods is not None:
+                df = df.loc[df['period'].isin(periods)]
+            return df if columns is None else df[columns]
+
+        if name != "league_record":
+            return _compact_frame(name, pd.read_parquet(parquet_path, columns=columns, memory_map=True))
+
+        read_columns = None if columns is None else ["team", "period"] + [x for x in columns if x not in ["team", "period"]]
+        filters = None if periods is None else [("period", "in", [int(x) for x in periods])]
+        df = pd.read_parquet(parquet_path, columns=read_columns, filters=filters, memory_map=True)
+        df["period"] = df["period"].astype(int)
+        df = _compact_frame(name, df.sort_values(by="period", kind="stable").set_index("team"))
+        df = df[["period"] + [x for x in df.columns if x != "period"]]
+        return df if columns is None else df[columns]
+
+    def migrate_pickles(self, *names):
+        """ Converts existing pickled frames (all of them by default) to columnar storage; the pickles are left in place """
+        for name in names or FRAME_PICKLES:
+            pickle_path = self._frame_path(name, "pickle")
+            if exists(pickle_path):
+                self.logger.info(f"Migrating {pickle_path.name} to columnar storage")
+                self.store_frame(name, pd.read_pickle(pickle_path))
+
+    def record(self, periods=None, columns=None):
+        """ league_record limited to the given periods/columns (only those are read from storage) """
+        return self.load_frame("league_record", columns=columns, periods=periods)
+
+    def memory_report(self):
+        """ Footprint of each stored frame: rows, columns, memory (deep, strings and categories counted in full), size on disk and dtypes """
+        report = []
+        for name in FRAME_PICKLES:
+            if not self._frame_exists(name):
+                continue
+            df = getattr(self, name)
+            usage = df.memory_usage(deep=True)
+            path = self._frame_path(name, "parquet") if pa is not None and exists(self._frame_path(name, "parquet")) else self._frame_path(name, "pickle")
+            disk = sum(x.stat().st_size for x in path.rglob("*") if x.is_file()) if path.is_dir() else path.stat().st_size
+            report.append({
+                "frame": name,
+                "rows": len(df),
+                "columns": df.shape[1],
+                "memory_mb": round(usage.sum() / 2**20, 3),
+                "disk_mb": round(disk / 2**20, 3),
+                "largest_column": usage.drop("Index").idxmax() if df.shape[1] else None,
+                "dtypes": ", ".join(f"{x} x{n}" for x, n in df.dtypes.astype(str).value_counts().items()),
+            })
+        return pd.DataFrame(report, columns=["frame", "rows", "columns", "memory_mb", "disk_mb", "largest_column", "dtypes"]).set_index("frame")
+
+    # LOAD FROM HTML FILES
+    @cached_property
+    def souped_league_home(self):
+        with self._artifact("html/league_home.html").open("r", encoding="utf-8") as f:
+            return bs4.BeautifulSoup(f, "html.parser")
+
+    @cached_property
+    def souped_league_standings(self):
+        with self._artifact("html/league_standings.html").open("r", encoding="utf-8") as f:
+            return bs4.BeautifulSoup(f, "html.parser")
+
+    @cached_property
+    def souped_allplayers(self):
+        with self._artifact("html/all_players.html").open("r", encoding="utf-8") as f:
+            return bs4.BeautifulSoup(f, "html.parser")
+
+    # LOAD FROM DF FILES
+    @cached_property
+    def league_df(self):
+        return self.load_frame("league_df")
+
+    @cached_property
+    def roster_current(self):
+        return self.load_frame("roster_current")
+
+    @cached_property
+    def roster_2022(self):
+        return self.load_frame("roster_2022")
+
+    @cached_property
+    def zscores(self):
+        return self.load_frame("zscores")
+
+    @cached_property
+    def league_record(self):
+        return self.load_frame("league_record")
     
-    def update(self, refresh=False):
-        """ Updates local html and pickle files so as to minimize requests on the website; class methods run from pickled backups """
-        def _html_updater():
+    def update(self, refresh=False, workers=8, browsers=3, profile=False, rate=5.0):
+        """ Refreshes html/ and the stored frames from CBS; frames whose pages are unchanged are kept unless refresh=True (stage timings: logs/update_metrics.json) """
+        # Fetch cache: ETag/Last-Modified and a content hash per page (pickle/fetch_cache.json); refresh=True ignores it
+        fetch_cache_path = self.root / "pickle/fetch_cache.json"
+        fetch_cache = {}
+        if exists(fetch_cache_path) and not refresh:
+            with fetch_cache_path.open("r", encoding="utf-8") as f:
+                fetch_cache = json.load(f)
+        # Frame inputs: the content hash of every page each stored frame was built from (pickle/frame_inputs.json)
+        frame_inputs_path = self.root / "pickle/frame_inputs.json"
+        frame_inputs = {}
+        if exists(frame_inputs_path) and not refresh:
+            with frame_inputs_path.open("r", encoding="utf-8") as f:
+                frame_inputs = json.load(f)
+        changed = set()
+
+        def __inputs(pages):
+            return {x: fetch_cache.get(x, {}).get("hash") for x in pages}
+
+        # Changed pages are written to a staging folder and only moved into html/ once the whole refresh succeeded
+        staging = self.root / f"html/.staging-{os.getpid()}"
+        snapshot = {}
+        parsed = {}
+        parse_locks = defaultdict(threading.Lock)
+        parse_locks_lock = threading.Lock()
+
+        def __parse(filename, text=None):
+            """ Parsed contents of a league page (roster frame, or players/team of a team page), from text or html/; parsed once per update """
+            with parse_locks_lock:
+                lock = parse_locks[filename]
+            with lock:
+                if filename not in parsed:
+                    if text is None:
+                        text = self._page_text(filename)
+                    with self.metrics.span(f"parse {filename}", stage="frames", bytes=len(text)) as span:
+                        if filename.startswith("team_"):
+                            parsed[filename] = self._team_page_parser(filename[len("team_"):], text=text)
+                            span["rows"] = len(parsed[filename][0])
+                        else:
+                            parsed[filename] = self._roster_builder(None, text=text)
+                            span["rows"] = len(parsed[filename])
+                return parsed[filename]
+
+        def _html_updater(s, pool):
+            """ Logs in and downloads the league home, then queues the other league pages on pool; returns {page: future} """
+
             # UPDATE HTML FILES
-            with requests.Session() as s:
-                s.post(self.config["login_url"], data=self.config["login_info"])
-
-                # League home
-                league_home_rawhtml = s.get(self.config["league_home"])
-                league_home_rawhtml.encoding = "utf-8"
-                souped_league_home = bs(league_home_rawhtml.text, "html.parser")
-                html_path = Path(__file__).parent / "html/league_home.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_league_home))
-
-                # League standings
-                league_standings_rawhtml = s.get(self.config["league_standings"])
-                league_standings_rawhtml.encoding = "utf-8"
-                souped_league_standings = bs(league_standings_rawhtml.text, "html.parser")
-                html_path = Path(__file__).parent / "html/league_standings.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_league_standings))
-
-                team_1_html = s.get("https://forkeeps.basketball.cbssports.com/teams/1")
-                team_1_html.encoding = "utf-8"
-                souped_team_1 = bs(team_1_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_1.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_1))
-
-                team_2_html = s.get("https://forkeeps.basketball.cbssports.com/teams/2")
-                team_2_html.encoding = "utf-8"
-                souped_team_2 = bs(team_2_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_2.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_2))
-
-                team_3_html = s.get("https://forkeeps.basketball.cbssports.com/teams/3")
-                team_3_html.encoding = "utf-8"
-                souped_team_3 = bs(team_3_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_3.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_3))
-
-                team_4_html = s.get("https://forkeeps.basketball.cbssports.com/teams/4")
-                team_4_html.encoding = "utf-8"
-                souped_team_4 = bs(team_4_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_4.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_4))
-
-                team_5_html = s.get("https://forkeeps.basketball.cbssports.com/teams/5")
-                team_5_html.encoding = "utf-8"
-                souped_team_5 = bs(team_5_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_5.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_5))
-
-                team_6_html = s.get("https://forkeeps.basketball.cbssports.com/teams/6")
-                team_6_html.encoding = "utf-8"
-                souped_team_6 = bs(team_6_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_6.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_6))
-
-                team_7_html = s.get("https://forkeeps.basketball.cbssports.com/teams/7")
-                team_7_html.encoding = "utf-8"
-                souped_team_7 = bs(team_7_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_7.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_7))
-
-                team_8_html = s.get("https://forkeeps.basketball.cbssports.com/teams/8")
-                team_8_html.encoding = "utf-8"
-                souped_team_8 = bs(team_8_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_8.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_8))
-
-                team_9_html = s.get("https://forkeeps.basketball.cbssports.com/teams/9")
-                team_9_html.encoding = "utf-8"
-                souped_team_9 = bs(team_9_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_9.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_9))
-
-                team_10_html = s.get("https://forkeeps.basketball.cbssports.com/teams/10")
-                team_10_html.encoding = "utf-8"
-                souped_team_10 = bs(team_10_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/team_10.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_team_10))
-
-                all_players_html = s.get(self.config["league_allplayers_cy"])
-                all_players_html.encoding = "utf-8"
-                souped_all_players = bs(all_players_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/all_players.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_all_players))
-
-                roster_2022_html = s.get(self.config["league_2022"])
-                roster_2022_html.encoding = "utf-8"
-                souped_roster_2022 = bs(roster_2022_html.text, "html.parser")
-                html_path = Path(__file__).parent / "html/roster_2022.html"
-                with html_path.open("w", encoding="utf-8") as file:
-                    file.write(str(souped_roster_2022))
+            def __fetch_page(s, url, filename):
+                """ Downloads a single page (a conditional request when it is cached), archives it and stages it if its content changed; returns the page html if it changed """
+                html_path = self.root / f"html/{filename}.html"
+                cached = fetch_cache.get(filename, {}) if exists(html_path) else {}
+                headers = {}
+                if cached.get("etag"):
+                    headers["If-None-Match"] = cached["etag"]
+                if cached.get("last_modified"):
+                    headers["If-Modified-Since"] = cached["last_modified"]
+
+                with self.metrics.span(filename, kind="page", stage="html") as span:
+                    page_html = self.scheduler.get(s, url, headers=headers)
+                    span.update(bytes=len(page_html.content), status=page_html.status_code)
+                    page_html.raise_for_status()  # An error page (after the retries) aborts the update instead of replacing the stored page
+                    if page_html.status_code == 304:
+                        span["changed"] = False
+                        entry = self._archive_page(None, cached["hash"]) if cached.get("hash") else {"codec": None}
+                        if entry["codec"] is None:
+                            # Not archived yet (fetch cache older than the archive, or a pruned archive); archive the stored copy
+                            content = html_path.read_bytes()
+                            entry = self._archive_page(content, hashlib.sha256(content).hexdigest())
+                        snapshot[filename] = {"url": url, **entry}
+                        return None
+
+                    digest = hashlib.sha256(page_html.content).hexdigest()
+                    span["changed"] = digest != cached.get("hash")
+                    if page_html.status_code == 200:
+                        fetch_cache[filename] = {
+                            "url": url,
+                            "etag": page_html.headers.get("ETag"),
+                            "last_modified": page_html.headers.get("Last-Modified"),
+                            "hash": digest,
+                        }
+                    if page_html.status_code == 200:
+                        snapshot[filename] = {"url": url, **self._archive_page(page_html.content, digest)}
+                    if not span["changed"]:
+                        return None
+
+                    # The page is stored as served (no parse/re-serialize round trip)
+                    staging.mkdir(exist_ok=True)
+                    _atomic_write(staging / f"{filename}.html", page_html.content)
+                    self._staged_pages[filename] = staging / f"{filename}.html"
+                    changed.add(filename)
+                return page_html.content.decode("utf-8", errors="replace")
+
+            def __fetch_and_parse(s, url, filename):
+                """ Fetches a page and, if it changed, parses it in memory right away (while the other downloads continue) """
+                text = __fetch_page(s, url, filename)
+                if text is not None and filename != "league_standings":
+                    __parse(filename, text)
+
+            # Login, then the league home (fetched first; the team count is read from its standings and shared with the record stage)
+            try:
+                self.scheduler.post(s, self._url(self.config["login_url"]), data=self.config["login_info"])
+                league_home = __fetch_page(s, self._url(self.config["league_home"]), "league_home")
+                if league_home is None:
+                    league_home = self._page_text("league_home")
+                souped_league_home = bs4.BeautifulSoup(league_home, "html.parser")
+                team_ids = self._team_ids(souped_league_home)
+            except BaseException as e:
+                league_teams.set_exception(e)
+                raise
+            league_teams.set_result(team_ids)
+
+            # The big player pages go first so their parses overlap the team page downloads
+            pages = {
+                "all_players": self._url(self.config["league_allplayers_cy"]),
+                "roster_2022": self._url(self.config["league_2022"]),
+                "league_standings": self._url(self.config["league_standings"]),
+                **{
+                    f"team_{t}": self._url(f"/teams/{t}")
+                    for t in team_ids
+                },
+            }
+
+            # Remaining pages are fetched by a bounded worker pool (workers=1 fetches them in order)
+            return {
+                filename: pool.submit(__fetch_and_parse, s, url, filename)
+                for filename, url in pages.items()
+            }
 
+        def _html_finisher(fetches):
+            """ Waits for every page (the first failed download aborts the update) """
+            for future in as_completed(fetches.values()):
+                future.result()
+            self.logger.info(f"Changed pages: {sorted(changed) or 'none'}")
+
+        def _committer(built, recorded):
+            """ Once every page, frame and the weekly record of the refresh are in: moves the staged pages into html/, stores the rebuilt frames (with the page hashes they were built from) and the record (with the config's current period), then saves the fetch cache and the archive manifest """
+            for filename, path in list(self._staged_pages.items()):
+                os.replace(path, self.root / f"html/{filename}.html")
+                del self._staged_pages[filename]
             self.logger.info(f"\nLAST HTML UPDATE: {datetime.now()}")
-        
-        def _pickle_updater():
-            pickled_league_df = self._league_builder()
-            
-            pickled_roster_df = self._roster_builder(
-                Path(__file__).parent / "html/all_players.html"
-            )
-        
-            pickled_roster_2022 = self._roster_builder(
-                Path(__file__).parent / "html/roster_2022.html"
-            ).drop(columns=["salary", "position", "contract"])
-            
-            pickled_zscores = self._zroster_builder(pickled_roster_df.drop(columns=["salary", "position", "contract"]))
-            
-            pickled_league_df, pickled_roster_df = self._additional_roster_filler(
-                pickled_league_df, pickled_roster_df
-            )
-
-            pickled_league_df.to_pickle(
-                Path(__file__).parent / "pickle/pickled_league_df.pkl"
-            )
-            pickled_roster_df.to_pickle(
-                Path(__file__).parent / "pickle/pickled_roster_df.pkl"
-            )
-            pickled_roster_2022.to_pickle(
-                Path(__file__).parent / "pickle/pickled_roster_2022.pkl"
-            )
-            pickled_zscores.to_pickle(
-                Path(__file__).parent / "pickle/pickled_zscores.pkl"
-            )
-        
+
+            for frames, pages in built:
+                with self.metrics.span(f"store {', '.join(frames)}", kind="store"):
+                    for name, frame in frames.items():
+                        self.store_frame(name, frame)
+                frame_inputs.update({name: __inputs(pages) for name in frames})
+                _atomic_write(frame_inputs_path, json.dumps(frame_inputs, indent=4))
+
+            record_df, period_no, periods = recorded
+
+            #Update the config file with the current period
+            with open(self.c_path, "r") as config_file:
+                config = json.load(config_file)
+
+            config.update({'league_period':f'{period_no}'})
+
+            _atomic_write(self.c_path, json.dumps(config, indent=4))
+
+            #Update the class record (the pickle loads occur on class init)
+            self.league_record = record_df
+
+            with self.metrics.span("store league_record", kind="store"):
+                self.store_frame("league_record", record_df, periods=periods)
+            self.logger.info(f"\nLAST RECORD UPDATE: {datetime.now()}")
+
+            _atomic_write(fetch_cache_path, json.dumps(fetch_cache, indent=4))
+            self._write_manifest(snapshot)
+            rebuilt = {name for frames, _ in built for name in frames}
+            self.logger.info(f"Rebuilt frames: {sorted(rebuilt) or 'none'}")
             self.logger.info(f"\nLAST PICKLE UPDATE: {datetime.now()}")
+            return rebuilt
+        
+        def _pickle_updater(fetches):
+            """ Frame builders, each started as soon as its pages are in; rebuilds only the frames whose html inputs differ from the ones they were built from (every frame with refresh=True, and any frame not stored yet); returns [(frames, input pages)] for _committer """
+            def __stale(name, pages):
+                return refresh or not self._frame_exists(name) or frame_inputs.get(name) != __inputs(pages)
+
+
+            def __roster_2022():
+                """ roster_2022 (needs its own page only) """
+                fetches["roster_2022"].result()
+                if not __stale("roster_2022", ["roster_2022"]):
+                    return None
+                return {"roster_2022": __parse("roster_2022").drop(columns=["salary", "position", "contract"])}, ["roster_2022"]
+
+            def __zscores():
+                """ zscores (needs the all players page only) """
+                fetches["all_players"].result()
+                if not __stale("zscores", ["all_players"]):
+                    return None
+                with self.metrics.span("_zroster_builder", stage="frames") as span:
+                    zscores = self._zroster_builder(__parse("all_players").drop(columns=["salary", "position", "contract"]))
+                    span["rows"] = len(zscores)
+                return {"zscores": zscores}, ["all_players"]
+
+            def __league():
+                """ league_df and roster_current (need the standings, all players and every team page) """
+                pages = ["league_home", "league_standings", "all_players", *[x for x in fetches if x.startswith("team_")]]
+                for name in pages[1:]:
+                    fetches[name].result()
+                if not (__stale("league_df", pages) or __stale("roster_current", pages)):
+                    return None
+                with self.metrics.span("_league_builder", stage="frames") as span:
+                    league_df = self._league_builder()
+                    span["rows"] = len(league_df)
+                with self.metrics.span("_additional_roster_filler", stage="frames") as span:
+                    frames = dict(zip(["league_df", "roster_current"], self._additional_roster_filler(
+                        league_df, __parse("all_players"), parsed=[__parse(f"team_{t}") for t in league_df["team_id"]]
+                    )))
+                    span["rows"] = len(frames["roster_current"])
+                return frames, pages
+
+            # One thread per builder; each only waits on page downloads, never on another builder
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                builders = [pool.submit(x) for x in [__roster_2022, __zscores, __league]]
+                return [x for x in (y.result() for y in builders) if x is not None]
         
         def _weekly_totals_updater(refresh=False):
-            """ Scrapes weekly head-to-head results for the league """
+            """ Scrapes weekly head-to-head results for the league; returns (record, current period, periods to rewrite or None for all) for _committer """
+            
+            from selenium import webdriver
+            from selenium.webdriver.chrome.service import Service
+            from selenium.webdriver.common.by import By
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
+            from selenium.common.exceptions import WebDriverException
             
-            def __login_sequence(destination_url):
-                """ Login sequence for CBS website """
-                self.driver.get('https://www.cbssports.com/user/login/?redirectUrl=https%3A%2F%2Fwww.cbssports.com%2F%3Flogin%3Dconfirmed')
-                time.sleep(4)
-                self.driver.find_element(By.ID, 'app_login_username').send_keys(os.getenv("CBS_USER"))
-                self.driver.find_element(By.ID, 'app_login_password').send_keys(os.getenv("CBS_PASS"))
-                self.driver.find_element(By.CLASS_NAME, 'BasicButton').click()
-                time.sleep(1)
-                self.driver.get(destination_url)
-                time.sleep(1)
+            def __browser_get(driver, url, *locators):
+                """ Loads a page in the browser and waits for the locators; paced and retried by the request scheduler """
+                def __load():
+                    driver.get(url)
+                    for locator in locators:
+                        WebDriverWait(driver, self.scheduler.timeout[1]).until(EC.presence_of_element_located(locator))
+                self.scheduler.call(__load, retry_on=(WebDriverException,))
+
+            def __login_sequence(driver, destination_url):
+                """ Login sequence for CBS website (explicit waits instead of fixed sleeps) """
+                wait = WebDriverWait(driver, 30)
+                __browser_get(driver, self._url(LOGIN_URL), (By.ID, 'app_login_username'))
+                driver.find_element(By.ID, 'app_login_username').send_keys(os.getenv("CBS_USER"))
+                driver.find_element(By.ID, 'app_login_password').send_keys(os.getenv("CBS_PASS"))
+                login_button = driver.find_element(By.CLASS_NAME, 'BasicButton')
+                login_button.click()
+                wait.until(EC.staleness_of(login_button))
+                __browser_get(driver, destination_url, (By.CSS_SELECTOR, 'div.select_div_label_container'))
                    
 
             def __record_formatter(df, periods: list):
                 df = df.astype({'score':str, '3pt':float, 'ast':float, 'bk':float, 'fgp':float, 'ftp':float, 'g':int, 'min':float, 'pts':float, 'st':float, 'to':float, 'trb':float})
                 df.set_index('team', inplace=True)
-                return df
+                return _compact_frame("league_record", df)
             
             
-            #SELENIUM WEB DRIVER
-            self.service = Service()
-            self.options = webdriver.FirefoxOptions()
-            self.options.add_argument("--headless")
-            self.driver = webdriver.Firefox(service=self.service, options=self.options)
-            
-            #Login to CBS
-            __login_sequence('https://forkeeps.basketball.cbssports.com/scoring/standard')
+            def __start_browser():
+                """ Starts a logged-in headless Firefox """
+                self.service = Service()
+                self.options = webdriver.FirefoxOptions()
+                self.options.add_argument("--headless")
+                driver = webdriver.Firefox(service=self.service, options=self.options)
+                driver.set_page_load_timeout(self.scheduler.timeout[1])
+                __login_sequence(driver, scoring_url)
+                return driver
+
+            def __element_text(souped, element_id):
+                """ Visible text of an element in raw html (whitespace collapsed like selenium's .text); None if absent """
+                element = souped.find(id=element_id)
+                if element is None:
+                    return None
+                return " ".join(element.get_text(" ").split())
+
+            def __period_label(html):
+                """ Reads the 'PERIOD n (...)' selector label from a raw scoring page """
+                label = bs4.BeautifulSoup(html, "html.parser").select_one('div.select_div_label_container')
+                return " ".join(label.get_text(" ").split()) if label is not None else None
+
+            def __matchup_scores(p, get_text):
+                """ Arranges a matchup page's values as [period, team, opponent, score, cats...] for home and away """
+                away_team = get_text('T_CAT_topSBAWAY')
+                home_team = get_text('T_CAT_topSBHOME')
+                home_scores = [int(p), home_team, away_team, get_text('home_big_score')] + [get_text('homeocats' + str(y)) for y in range(0, 11)]
+                away_scores = [int(p), away_team, home_team, get_text('away_big_score')] + [get_text('awayocats' + str(y)) for y in range(0, 11)]
+                return home_scores, away_scores
+
+            def __http_session():
+                """ Pooled requests session carrying the CBS login; cookies come from disk, or from one browser login that is then saved """
+                s = requests.Session()
+                adapter = requests.adapters.HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+                s.mount("https://", adapter)
+                s.mount("http://", adapter)
+
+                if exists(cookie_path):
+                    with cookie_path.open("r", encoding="utf-8") as f:
+                        for cookie in json.load(f):
+                            s.cookies.set(cookie["name"], cookie["value"], domain=cookie.get("domain"), path=cookie.get("path", "/"))
+                    full_period = __period_label(self.scheduler.get(s, scoring_url).text)
+                    if full_period:
+                        self.logger.info("Scoring pages: reusing saved login cookies")
+                        return s, full_period
+
+                #Saved cookies missing or expired; log in through the browser and keep its cookie jar
+                driver = __start_browser()
+                drivers.append(driver)
+                cookies = [{x: c.get(x) for x in ["name", "value", "domain", "path"]} for c in driver.get_cookies()]
+                for cookie in cookies:
+                    s.cookies.set(cookie["name"], cookie["value"], domain=cookie["domain"], path=cookie["path"] or "/")
+                _atomic_write(cookie_path, json.dumps(cookies, indent=4), mode=0o600)  # Login session cookies: owner only
+
+                full_period = __period_label(self.scheduler.get(s, scoring_url).text)
+                if not full_period:
+                    full_period = driver.find_element(By.CSS_SELECTOR, 'div.select_div_label_container').text
+                return s, full_period
+
+            def __complete(scores):
+                """ True if a matchup row has both team names, a score and a numeric value for every cat (empty elements aren't) """
+                try:
+                    [float(x) for x in scores[4:]]
+                except (TypeError, ValueError):
+                    return False
+                return all(scores[1:4])
+
+            def __http_scrape(s, p, t):
+                """ Reads one matchup page over HTTP; None if the page didn't render its values """
+                with self.metrics.span(f"scoring {p}/{t} (http)", kind="scoring") as span:
+                    page = self.scheduler.get(s, f'{scoring_url}/{p}/{t}')
+                    span.update(bytes=len(page.content), status=page.status_code)
+                    souped_page = bs4.BeautifulSoup(page.text, "html.parser")
+                    scores = __matchup_scores(p, lambda z: __element_text(souped_page, z))
+                    readable = all(__complete(x) for x in scores)
+                    span["rows"] = 2 if readable else 0
+                if not readable:
+                    self.logger.warning(f"Scoring page {p}/{t} not readable over HTTP; queued for selenium")
+                    return None
+                return scores
+
+            def __browser_worker(n, driver, work_queue, results):
+                """ One pool member: drains (period, matchup) pages from the shared queue with its own logged-in driver """
+                if driver is None:
+                    driver = __start_browser()
+                    drivers.append(driver)
+                while True:
+                    try:
+                        p, t = work_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    with self.metrics.span(f"scoring {p}/{t} (selenium driver {n})", kind="scoring", stage="record", rows=2):
+                        __browser_get(driver, f'{scoring_url}/{p}/{t}', (By.ID, 'homeocats10'), (By.ID, 'away_big_score'))
+                        results[(p, t)] = __matchup_scores(p, lambda z: driver.find_element(By.ID, z).text)
+
+            scoring_url = self._url('/scoring/standard')
+            cookie_path = self.root / "pickle/cbs_cookies.json"
+            drivers = []
+
+            #Login to CBS (HTTP session; selenium web drivers are only started if required)
+            s, full_period = __http_session()
           
-            full_period = self.driver.find_element(By.CSS_SELECTOR, 'div.select_div_label_container').text
             period_date = re.search(r'(?:([^,]*\,\s)){2}(.*?)(?=\))', full_period).group(2)
             period_no = int(re.search(r'(?<=PERIOD\s).*(?=\s\()', full_period).group(0))
             full_date = datetime.strptime(str(period_date).replace(' ', '-') + '-' + str(datetime.today().year), '%b-%d-%Y')
-                
-            #Update the config file with the current period
-            with open(self.c_path, "r") as config_file:
-                config = json.load(config_file)
-  
-            config.update({'league_period':f'{period_no}'})
-
-            with open(self.c_path, 'w') as config_file:
-                config_file.write(json.dumps(config, indent=4))
             
-            #Create a new DF
-            record_df = pd.DataFrame()
-
             start_loop = 1
-            if refresh == True: #Full updating forced
-                period_loop = period_no
+            period_loop = period_no
+            stored_record = pd.DataFrame()
+            
+            #Incremental update: keep stored periods, re-scrape from the last stored one (it was live when saved) onward
+            if refresh == False and self._frame_exists("league_record"): #refresh=True forces a full rebuild
+                stored_periods = set(self.load_frame("league_record", columns=['period'])['period'].astype(int))
+                missing_periods = [x for x in range(1, period_no + 1) if x not in stored_periods]
+                start_loop = min(missing_periods + [max(stored_periods, default=1), period_no])
+                stored_record = self.load_frame("league_record", periods=[x for x in stored_periods if x < start_loop])
+                self.logger.info(f"Incremental record update: scraping periods {start_loop}-{period_loop}")
             
             #Harvest the data
             cats = ['period', 'team', 'opponent', 'score', '3pt', 'ast', 'bk', 'fgp', 'ftp', 'g', 'min', 'pts', 'st', 'to', 'trb', 'period']
+            matchups = max(1, len(league_teams.result()) // 2)  # One matchup page per pair of teams (team ids come from the html stage's league home)
+            pages = [(p, t) for p in range(start_loop, (period_loop + 1)) for t in range(1, matchups + 1)]
+            results = {}
             
-            #Start the harvest loop - p for periods, t for teams to iterate through the urls
-            for p in range(start_loop, (period_loop + 1)):
-                for t in range(1, 6):
-                    self.driver.get(f'https://forkeeps.basketball.cbssports.com/scoring/standard/{p}/{t}')
-                    time.sleep(1)
-                   
-                    #Arrange the stats for insertion into dictionary
-                    away_scores = [self.driver.find_element(By.ID, z).text for z in ['awayocats' + str(y) for y in range(0, 11)]]
-                    away_scores.insert(0, self.driver.find_element(By.ID,'T_CAT_topSBAWAY').text)
-                    away_scores.insert(1, self.driver.find_element(By.ID,'away_big_score').text)
-                    home_scores = [self.driver.find_element(By.ID, z).text for z in ['homeocats' + str(y) for y in range(0, 11)]]
-                    home_scores.insert(0, self.driver.find_element(By.ID,'T_CAT_topSBHOME').text)
-                    home_scores.insert(1, self.driver.find_element(By.ID,'T_CAT_topSBAWAY').text)
-                    home_scores.insert(2, self.driver.find_element(By.ID,'home_big_score').text)
-                    away_scores.insert(1, self.driver.find_element(By.ID,'T_CAT_topSBHOME').text)
-                    
-                    #Insert periods
-                    home_scores.insert(0, int(p))
-                    away_scores.insert(0, int(p))
-                    
-                    #Insert the entry into the dataframe
-                    new_home = pd.DataFrame([{x:y for x, y in zip(cats, home_scores)}])
-                    new_away = pd.DataFrame([{x:y for x, y in zip(cats, away_scores)}])
-                
-                    record_df = pd.concat([record_df, new_home], axis=0)
-                    record_df = pd.concat([record_df, new_away], axis=0)
-                    
-                    
-            self.driver.quit()
+            #HTTP pass - p for periods, t for matchups to iterate through the urls
+            browser_queue = queue.Queue()
+            for p, t in pages:
+                scores = __http_scrape(s, p, t)
+                if scores is None:
+                    browser_queue.put((p, t))
+                else:
+                    results[(p, t)] = scores
+            s.close()
             
-            #Apply the formatting function 
-            formatted_record_df = __record_formatter(record_df, list(range(1, (int(self.config['league_period']) + 1))))
+            #Browser pass - a pool of logged-in drivers splits whatever HTTP couldn't read
+            try:
+                if not browser_queue.empty():
+                    pool_size = max(1, min(browsers, browser_queue.qsize()))
+                    pool_drivers = drivers + [None] * (pool_size - len(drivers))
+                    self.logger.info(f"Selenium pool: {pool_size} drivers for {browser_queue.qsize()} pages")
+                    with ThreadPoolExecutor(max_workers=pool_size) as pool:
+                        for future in [pool.submit(__browser_worker, n, d, browser_queue, results) for n, d in enumerate(pool_drivers)]:
+                            future.result()
+            finally:
+                for driver in drivers:
+                    driver.quit()
             
-            print(formatted_record_df)
+            #Insert the entries into the dataframe (in period/matchup order)
+            with self.metrics.span("record frame") as span:
+                record_df = pd.DataFrame(
+                    [{x:y for x, y in zip(cats, scores)} for p_t in pages for scores in results[p_t]]
+                )
+                
+                #Apply the formatting function 
+                formatted_record_df = __record_formatter(record_df, list(range(1, (int(self.config['league_period']) + 1))))
+                span["rows"] = len(formatted_record_df)
             
-            #Update the class record (the pickle loads occur on class init)
-            self.league_record = formatted_record_df
+            #Merge with the periods kept from the stored record
+            if not stored_record.empty:
+                formatted_record_df = _compact_frame("league_record", pd.concat([stored_record, formatted_record_df], axis=0))
             
-            #Pickle
-            formatted_record_df.to_pickle(
-                Path(__file__).parent / "pickle/pickled_record.pkl")
+            print(formatted_record_df)
             
-            #Log a successful update        
-            self.logger.info(f"\nLAST RECORD UPDATE: {datetime.now()}")
+            #Stored by _committer (with parquet only the scraped periods' partitions are rewritten)
+            return formatted_record_df, period_no, None if refresh else list(range(start_loop, period_loop + 1))
         
-        _html_updater()
-        _pickle_updater()
-        _weekly_totals_updater(refresh=refresh)
+        league_teams = Future()  # The league's team ids, once the league home is in
+
+        def __stage(name, func, *args):
+            """ Runs one pipeline stage under its metrics span """
+            with self.metrics.span(name, kind="stage"):
+                return func(*args)
+
+        self._updating = True
+        self.metrics = UpdateMetrics(self.logger, profile=profile)
+        self.scheduler = RequestScheduler(rate=rate, burst=workers, logger=self.logger)
+        self.metrics.start()
+        try:
+            # Pipeline: the weekly results scrape needs none of the league pages and runs alongside the html stage; each frame builder
+            # starts once its own pages are in, so the refresh takes about as long as its longest chain rather than the sum of the stages
+            with ThreadPoolExecutor(max_workers=2) as stages:
+                record = stages.submit(__stage, "record", _weekly_totals_updater, refresh)
+                with requests.Session() as s, ThreadPoolExecutor(max_workers=workers) as pool:
+                    # Pooled keep-alive connections, one per worker; all workers share the login
+                    adapter = requests.adapters.HTTPAdapter(
+                        pool_connections=workers, pool_maxsize=workers
+                    )
+                    s.mount("https://", adapter)
+                    s.mount("http://", adapter)
+                    with self.metrics.span("html", kind="stage"):
+                        fetches = _html_updater(s, pool)
+                        frames = stages.submit(__stage, "frames", _pickle_updater, fetches)
+                        _html_finisher(fetches)
+                    built = frames.result()
+                recorded = record.result()
+                #Nothing of the refresh reaches html/, the stored frames, the record or the config unless every page, frame and period succeeded
+                rebuilt = __stage("commit", _committer, built, recorded)
+                self._invalidate("souped_league_home", "souped_league_standings", "souped_allplayers")
+                if rebuilt:
+                    self._invalidate(*rebuilt, "_lookup")
+                if "zscores" in rebuilt:
+                    self._punt_tables.clear()
+        finally:
+            self._updating = False
+            self._staged_pages = {}
+            shutil.rmtree(staging, ignore_errors=True)
+            self.logger.info(f"Retried requests: {self.scheduler.retried}")
+            self.metrics.finish(self.root / "logs/update_metrics.json")
+            for hook in UPDATE_HOOKS:
+                hook()
         
         
     def session(self):
         with requests.Session() as s:
-            s.post(self.config["login_url"], data=self.config["login_info"])
+            self.scheduler.post(s, self._url(self.config["login_url"]), data=self.config["login_info"])
             return s
 
+    def _team_ids(self, souped_league_home):
+        """ Reads the league's team ids from the league home standings; falls back to config["league_teams"] """
+        standings = souped_league_home.find("div", {"id": "hpfcLeagueStandings"})
+        team_ids = sorted(
+            set(re.findall(r'(?<=href="/teams/)(\d+)(?=")', str(standings))), key=int
+        )
+        if not team_ids:
+            self.logger.warning("No teams found on league home; using config league_teams")
+            team_ids = [str(t) for t in range(1, int(self.config.get("league_teams", 10)) + 1)]
+        return team_ids
+
+    # ARCHIVE: every fetched page is kept once per content hash (archive/objects/), each refresh gets a manifest (archive/manifests/)
+    def _archive_page(self, content, digest):
+        """ Stores a page's raw bytes under its sha256 unless already archived; returns its manifest entry """
+        for codec in ["zst", "gz"]:
+            path = self.root / f"archive/objects/{digest[:2]}/{digest}.{codec}"
+            if exists(path):
+                return {"hash": digest, "codec": codec}
+        if content is None:
+            return {"hash": digest, "codec": None}
+        codec, data = _compress(content)
+        path = self.root / f"archive/objects/{digest[:2]}/{digest}.{codec}"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(path, data)
+        return {"hash": digest, "codec": codec}
+
+    def _write_manifest(self, pages):
+        """ Timestamped manifest of one refresh: page name -> url, content hash, codec """
+        manifests = self.root / "archive/manifests"
+        manifests.mkdir(parents=True, exist_ok=True)
+        created = datetime.now()
+        _atomic_write(
+            manifests / f"{created:%Y%m%d-%H%M%S-%f}.json",
+            json.dumps({"created": created.isoformat(timespec="seconds"), "pages": dict(sorted(pages.items()))}, indent=4),
+        )
+
+    def snapshots(self):
+        """ Archived refreshes, oldest first (names are the manifests' timestamps) """
+        return sorted(x.stem for x in (self.root / "archive/manifests").glob("*.json"))
+
+    def snapshot_pages(self, snapshot=None):
+        """ Manifest pages of an archived refresh (the latest by default) """
+        snapshot = snapshot or self.snapshots()[-1]
+        with (self.root / f"archive/manifests/{snapshot}.json").open("r", encoding="utf-8") as f:
+            return json.load(f)["pages"]
+
+    def archived_page(self, entry):
+        """ Html of an archived page (manifest entry); only that object is read """
+        if entry.get("codec") is None:
+            entry = self._archive_page(None, entry["hash"])  # Manifests can list pages whose object was archived later
+            if entry["codec"] is None:
+                raise FileNotFoundError(f"Page {entry['hash']} is not in the archive")
+        path = self.root / f"archive/objects/{entry['hash'][:2]}/{entry['hash']}.{entry['codec']}"
+        return _decompress(path.read_bytes(), entry["codec"]).decode("utf-8", errors="replace")
+
+    def replay(self, snapshot=None):
+        """ Rebuilds league_df, roster_current, roster_2022 and zscores from an archived refresh (the latest by default); html/ and the stored frames are left as they are """
+        pages = self.snapshot_pages(snapshot)
+        texts = {}
+
+        def __page(name):
+            """ Decompresses an archived page on first use """
+            if name not in texts:
+                texts[name] = self.archived_page(pages[name])
+            return texts[name]
+
+        self._replay_pages = __page
+        try:
+            league_df = self._league_builder()
+            roster = self._roster_builder(None, text=__page("all_players"))
+            roster_2022 = self._roster_builder(None, text=__page("roster_2022")).drop(columns=["salary", "position", "contract"])
+            zscores = self._zroster_builder(roster.drop(columns=["salary", "position", "contract"]))
+            league_df, roster = self._additional_roster_filler(league_df, roster)
+        finally:
+            self._replay_pages = None
+        frames = {"league_df": league_df, "roster_current": roster, "roster_2022": roster_2022, "zscores": zscores}
+        return {name: _compact_frame(name, df) for name, df in frames.items()}
+
+    def _page_text(self, page):
+        """ Html of html/{page}.html (or of the archived page while replaying a snapshot, or of the staged page during an update) """
+        if self._replay_pages is not None:
+            return self._replay_pages(page)
+        with open(self._staged_pages.get(page, self.root / f"html/{page}.html"), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def _cached_parse(self, page, parser):
+        """ Runs parser on html/{page}.html, unless the page's content hash matches the result cached in pickle/parse_cache.json """
+        text = self._page_text(page)
+        if self._replay_pages is not None:
+            return parser(text)
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        cache_path = self.root / "pickle/parse_cache.json"
+        cache = {}
+        if exists(cache_path):
+            with cache_path.open("r", encoding="utf-8") as f:
+                cache = json.load(f)
+        if page in cache and cache[page]["hash"] == digest:
+            return cache[page]["result"]
+
+        result = parser(text)
+        cache[page] = {"hash": digest, "result": result}
+        _atomic_write(cache_path, json.dumps(cache))
+        return result
+
+    @staticmethod
+    def _standings_teams(page):
+        """ Decodes the FantasyGlobalChatJson blob on the standings page into team records (first entry per team name) """
+        start = page.index("FantasyGlobalChatJson")
+        teams = {}
+        try:
+            blob, _ = json.JSONDecoder().raw_decode(page, page.index("{", start))
+        except ValueError:
+            # Not strict json; fall back to scanning the team objects
+            blob = []
+            for x in re.findall(r'(?<="team" : {)[\s\S]*?(?=},)', "".join(page[start:].split("attrib"))):
+                fields = {key: re.search(fr'(?<="{key}" : ").*?(?=")', x) for key in ["id", "name", "long_abbr", "logo"]}
+                blob.append({"team": {key: value.group(0) for key, value in fields.items() if value is not None}})
+
+        def __walk(node):
+            if isinstance(node, dict):
+                team = node.get("team")
+                if isinstance(team, dict) and "id" in team and "name" in team:
+                    name = str(team["name"]).replace("'", "")
+                    if name not in teams:
+                        teams[name] = TeamRecord(
+                            team_id=str(team["id"]),
+                            name=name,
+                            manager=str(team.get("long_abbr", "")).replace("'", ""),
+                            logo_url=str(team.get("logo", "")).replace("'", ""),
+                        )
+                for value in node.values():
+                    __walk(value)
+            elif isinstance(node, list):
+                for value in node:
+                    __walk(value)
+
+        __walk(blob)
+        return [x._asdict() for x in teams.values()]
+
+    @staticmethod
+    def _home_standings(page):
+        """ Reads team records and display names from the league home standings table (one selector query) """
+        records = {}
+        for row in bs4.BeautifulSoup(_div_html(page, "hpfcLeagueStandings"), "html.parser").select('tr:has(a[href^="/teams/"])'):
+            t_id = row.select_one('a[href^="/teams/"]')["href"].split("/teams/")[1]
+            record = row.find("td", {"align": "right"})
+            tooltip = row.find("span", {"class": "tooltip", "title": True})
+            records[t_id] = {
+                "record": record.get_text() if record is not None else None,
+                "team_name": tooltip["title"] if tooltip is not None else row.select_one('a[href^="/teams/"]').get_text(),
+            }
+        return records
+
     # Builds the basic league info df on initialization
     def _league_builder(self):
-        teams_exclusion_list = []
-        df_output = pd.DataFrame(columns=self.config["tracked_datapoints"])
+        teams = [TeamRecord(**x) for x in self._cached_parse("league_standings", self._standings_teams)]
 
-        ls_split_html = str(self.souped_league_standings).split("FantasyGlobalChatJson")
-        teams_chunk = re.findall(
-            r'(?<="team" : {)[\s\S]*?(?=},)', "".join(ls_split_html[1].split("attrib"))
-        )
+        # NEXT: league home has the records and display names based on the team_id
+        standings = self._cached_parse("league_home", self._home_standings)
 
-        for x in teams_chunk:
-            # Team name
-            team_name = (
-                re.search(r'(?<="name" : ").*?(?=")', x).group(0).replace("'", "")
-            )
-            if team_name not in teams_exclusion_list:
-                teams_exclusion_list.append(team_name)
-            else:
-                continue
-            team_manager = (
-                re.search(r'(?<="long_abbr" : ").*?(?=")', x).group(0).replace("'", "")
-            )
-            team_logo = (
-                re.search(r'(?<="logo" : ").*?(?=")', x).group(0).replace("'", "")
-            )
-            team_id = re.search(r'(?<="id" : ").*?(?=")', x).group(0)
-            team_url = str(f"https://forkeeps.basketball.cbssports.com/teams/{team_id}")
-            new_entry = pd.DataFrame.from_dict(
-                {
-                    "manager": [team_manager],
-                    "team_id": team_id,
-                    "team_url": team_url,
-                    "logo_url": [team_logo],
-                }
-            )
-            df_output = pd.concat([df_output, new_entry])
-
-        # NEXT: Go to league home and get the records based on the team_id in the code.
-        lh_html = self.souped_league_home
-        standings = lh_html.find("div", {"id": "hpfcLeagueStandings"})
-
-        for x in str(standings).split("\n"):
-            if "href" in x:
-                # Team record
-                try:
-                    t_id = re.search(r'(?<=<a href="/teams/).*?(?=")', x).group(0)
-                    t_record = re.search(
-                        r'(?<=<td align="right">).*?(?=</td>)', x
-                    ).group(0)
-                    df_output["record"][df_output.team_id == t_id] = t_record
-                except:
-                    pass
-
-                # Team name
-                if 'span class="tooltip"' in x:
-                    team_name = re.search(
-                        r'(?<=class="tooltip" title=").*?(?=">)', x
-                    ).group(0)
-                    df_output["team_name"][df_output.team_id == t_id] = team_name
-                    continue
-                else:
-                    pass
-                try:
-                    regex_string = str(fr'(?<=<a href="/teams/{t_id}">).*?(?=</a>)')
-                    team_name = re.search(regex_string, x).group(0)
-                    df_output["team_name"][df_output.team_id == t_id] = team_name
-                except:
-                    pass
+        entries = [
+            {
+                "manager": x.manager,
+                "team_id": x.team_id,
+                "team_url": self._url(f"/teams/{x.team_id}"),
+                "logo_url": x.logo_url,
+                "record": standings.get(x.team_id, {}).get("record"),
+                "team_name": standings.get(x.team_id, {}).get("team_name"),
+            }
+            for x in teams
+        ]
+        df_output = pd.DataFrame(
+            entries,
+            columns=self.config["tracked_datapoints"] + [x for x in (entries[0] if entries else {}) if x not in self.config["tracked_datapoints"]],
+            dtype=object,
+        )
 
         df_output.set_index(["team_name"], inplace=True)
         return df_output
 
     # Builds the roster (can be used for past/present years)
-    def _roster_builder(self, html):
-
-        df_output = pd.DataFrame(columns=self.config["tracked_statcats"])
-
-        with open(html, "r", encoding="utf-8") as f:
-            souped_allplayers = bs(f, "html.parser")
-
-        raw_allplayers = souped_allplayers.find("div", {"id": "sortableStats"})
-
-        for x in str(raw_allplayers).split("\n"):
+    def _roster_builder(self, html, backend="stream", text=None):
+        """ Parses a player stats page into a roster df. backend="stream" scans the raw file once; backend="soup" parses it with BeautifulSoup (same output, much slower). text (the page html) replaces reading the file, e.g. for archived pages """
+
+        roster_columns = {
+            x: []
+            for x in ["player_name", "team_id", "salary", "contract", "g", "mpg", "fg", "fgp", "ft", "ftp",
+                      "3pt", "3ptp", "rpg", "apg", "spg", "tpg", "bpg", "ppg", "cbs_rank"]
+        }
+        stat_names = list(roster_columns)[4:]
+
+        def __add_player(player_name, team_id, stats_list):
+            stats = [stats_list[n] for n in range(0, 15)]  # IndexError on short rows, before anything is appended
+            roster_columns["player_name"].append(_html_text(player_name))  # Raw pages keep entities (D&#39;Angelo)
+            roster_columns["team_id"].append(team_id)
+            roster_columns["salary"].append(8)
+            roster_columns["contract"].append("B")
+            for name, value in zip(stat_names, stats):
+                roster_columns[name].append(value)
+
+        if text is None:
+            with open(html, "r", encoding="utf-8") as f:
+                text = f.read()
+        if backend == "soup":
+            raw_allplayers = str(bs4.BeautifulSoup(text, "html.parser").find("div", {"id": "sortableStats"}))
+        else:
+            raw_allplayers = _div_html(text, "sortableStats")
+
+        for x in raw_allplayers.split("\n"):
 
             # Players on teams
             if "/teams/" in x:
-                player_name = re.search(
-                    r'(?<=playerpage/\d{4,9}.*">)(.*?)(?=</a>)', x
-                ).group(0)
-                team_id = int(
-                    re.search(r'(?<=<a href="/teams/)(.*?)(?=">)', x).group(0)
-                )
-
-                raw_stats = re.search(
-                    r'(?<=<td align="right")([\s\S]*?)(?=</tr>)', x
-                ).group(0)
-                stats_list = re.findall(r"(?<=>)([0-9.]+)(?=<)", raw_stats)
-
-                new_entry = pd.DataFrame.from_dict(
-                    {
-                        "player_name": [player_name],
-                        "team_id": [team_id],
-                        "salary": [8],
-                        "contract": ["B"],
-                        "g": [stats_list[0]],
-                        "mpg": [stats_list[1]],
-                        "fg": [stats_list[2]],
-                        "fgp": [stats_list[3]],
-                        "ft": [stats_list[4]],
-                        "ftp": [stats_list[5]],
-                        "3pt": [stats_list[6]],
-                        "3ptp": [stats_list[7]],
-                        "rpg": [stats_list[8]],
-                        "apg": [stats_list[9]],
-                        "spg": [stats_list[10]],
-                        "tpg": [stats_list[11]],
-                        "bpg": [stats_list[12]],
-                        "ppg": [stats_list[13]],
-                        "cbs_rank": [stats_list[14]],
-                    }
-                )
-                df_output = pd.concat([df_output, new_entry])
+                player_name = PLAYER_NAME_REGEX.search(x).group(0)
+                team_id = int(PLAYER_TEAM_REGEX.search(x).group(0))
+                raw_stats = PLAYER_STATS_REGEX.search(x).group(0)
+                stats_list = STAT_VALUE_REGEX.findall(raw_stats)
+                __add_player(player_name, team_id, stats_list)
 
             # Free agents
             else:
                 team_id = 0
                 try:
-                    player_name = re.search(
-                        r'(?<=playerpage/\d{4,9}.*">)(.*?)(?=</a>)', x
-                    ).group(0)
-                    raw_stats = re.search(
-                        r'(?<=<td align="right")([\s\S]*?)(?=</tr>)', x
-                    ).group(0)
-                    stats_list = re.findall(r"(?<=>)([0-9.]+)(?=<)", raw_stats)
-                    new_entry = pd.DataFrame.from_dict(
-                        {
-                            "player_name": [player_name],
-                            "team_id": [team_id],
-                            "salary": [8],
-                            "contract": ["B"],
-                            "g": [stats_list[0]],
-                            "mpg": [stats_list[1]],
-                            "fg": [stats_list[2]],
-                            "fgp": [stats_list[3]],
-                            "ft": [stats_list[4]],
-                            "ftp": [stats_list[5]],
-                            "3pt": [stats_list[6]],
-                            "3ptp": [stats_list[7]],
-                            "rpg": [stats_list[8]],
-                            "apg": [stats_list[9]],
-                            "spg": [stats_list[10]],
-                            "tpg": [stats_list[11]],
-                            "bpg": [stats_list[12]],
-                            "ppg": [stats_list[13]],
-                            "cbs_rank": [stats_list[14]],
-                        }
-                    )
-                    df_output = pd.concat([df_output, new_entry])
+                    player_name = PLAYER_NAME_REGEX.search(x).group(0)
+                    raw_stats = PLAYER_STATS_REGEX.search(x).group(0)
+                    stats_list = STAT_VALUE_REGEX.findall(raw_stats)
+                    __add_player(player_name, team_id, stats_list)
                 except:
                     pass
 
+        # Build the df in one step (tracked columns first, as before)
+        df_output = pd.DataFrame(
+            roster_columns,
+            columns=self.config["tracked_statcats"] + [x for x in roster_columns if x not in self.config["tracked_statcats"]],
+            dtype=object,
+        )
+
         # Data and formatting
         df_output = df_output.astype(
             {
@@ -532,240 +1407,133 @@ class CBS:
         # Pare the roster to save CPU time and allow for more accurate z scores
         condition_1 = df_output["cbs_rank"] <= 300
         condition_2 = df_output["team_id"] >= 1
-        df_output = df_output[condition_1 | condition_2]
+        df_output = df_output[condition_1 | condition_2].copy()
 
         # Add useful data columns
-        df_output["fgpg"] = df_output.apply(
-            lambda row: row.fg / row.g if row.g > 0 else 0, axis=1
-        ).round(2)
-        df_output["ftpg"] = df_output.apply(
-            lambda row: row.ft / row.g if row.g > 0 else 0, axis=1
-        ).round(2)
-        df_output["3ptpg"] = df_output.apply(
-            lambda row: row["3pt"] / row.g if row.g > 0 else 0, axis=1
-        ).round(2)
+        df_output["fgpg"] = (df_output["fg"] / df_output["g"]).where(df_output["g"] > 0, 0).round(2)
+        df_output["ftpg"] = (df_output["ft"] / df_output["g"]).where(df_output["g"] > 0, 0).round(2)
+        df_output["3ptpg"] = (df_output["3pt"] / df_output["g"]).where(df_output["g"] > 0, 0).round(2)
 
         # Set the index to player name
         df_output.set_index("player_name", inplace=True)
 
         return df_output
 
-    def _additional_roster_filler(self, league, roster):
-        """ Fills in the rest of the data from team pages: player salary, position, total weekly games """
-
-        # Goes through all the teams
-        for id in range(1, 11):
-
-            with open(
-                Path(__file__).parent / f"html/team_{id}.html", "r", encoding="utf-8"
-            ) as f:
-                souped_team = bs(f, "html.parser")
-
-            # Harvest data
-            raw_lineup = souped_team.find("div", {"id": "lineup_views"})
-            salary_list = []
-            games_list = []
-            weekly_game_counter = 0
-
-            player_names = re.findall(
-                r'(?<=aria-label=" ).*?(?= " class="playerLink")', str(raw_lineup)
-            )
-            positions = re.findall(r"(?<=\s)[FGC,]+(?=\s|\s)", raw_lineup.text)
-            # total_salary = re.search(r'(?<=Total Salary: ).*?(?=</td>)', str(raw_lineup)).group(0).strip()
-
-            for x in str(raw_lineup).split("\n"):
-                try:
-                    salary_cost = re.search(
-                        r'<td align="right">(\d+)<\/td><td align="right">([A-Z])<\/td>',
-                        x,
-                    ).group(1)
-                    salary_type = re.search(
-                        r'<td align="right">(\d+)<\/td><td align="right">([A-Z])<\/td>',
-                        x,
-                    ).group(2)
-                    player_salary = (salary_cost, salary_type)
-                    salary_list.append(player_salary)
-                except:
-                    pass
-                try:
-                    weekly_game_counter += int(
-                        re.search(r"(?:Home: )(\d+)", x).group(1)
-                    ) + int(re.search(r"(?:Away: )(\d+)", x).group(1))
-                except:
-                    pass
+    def _team_page_parser(self, team_id, text=None):
+        """ Harvests a team page: one row per rostered player (salary, contract, position) plus the team's weekly games/total salary; text (the page html) replaces reading the file """
+
+        raw_lineup = _div_html(text if text is not None else self._page_text(f"team_{team_id}"), "lineup_views")
+
+        player_names = [html.unescape(x) for x in LINEUP_PLAYER_REGEX.findall(raw_lineup)]
+        positions = LINEUP_POSITION_REGEX.findall(_html_text(raw_lineup))
+        # total_salary = re.search(r'(?<=Total Salary: ).*?(?=</td>)', raw_lineup).group(0).strip()
+
+        salary_list = []
+        weekly_game_counter = 0
+        for x in raw_lineup.split("\n"):
+            salary = LINEUP_SALARY_REGEX.search(x)
+            if salary is not None:
+                salary_list.append((salary.group(1), salary.group(2)))
+            home_games = LINEUP_HOME_REGEX.search(x)
+            away_games = LINEUP_AWAY_REGEX.search(x)
+            if home_games is not None and away_games is not None:
+                weekly_game_counter += int(home_games.group(1)) + int(away_games.group(1))
+
+        players = [
+            {"player_name": str(name), "salary": int(sal[0]), "contract": sal[1], "position": pos.replace(",", "")}
+            for name, sal, pos in zip(player_names, salary_list, positions)
+        ]
+        team = {
+            "team_id": str(team_id),
+            "weekly_games": weekly_game_counter,
+            "total_salary": sum([int(x[0]) for x in salary_list]),
+        }
+        return players, team
+
+    def _additional_roster_filler(self, league, roster, workers=8, parsed=None):
+        """ Fills in the rest of the data from team pages: player salary, position, total weekly games. parsed: the league's team pages already run through _team_page_parser (in league["team_id"] order) """
+
+        # Parse all the team pages (in parallel) into tidy player/team frames
+        if parsed is None:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                parsed = list(pool.map(self._team_page_parser, league["team_id"].tolist()))
+
+        players = pd.DataFrame(
+            [player for team_players, _ in parsed for player in team_players],
+            columns=["player_name", "salary", "contract", "position"],
+        )
+        teams = pd.DataFrame([team for _, team in parsed], columns=["team_id", "weekly_games", "total_salary"])
 
-            # Record data on league df
-            league["weekly_games"][league.team_id == str(id)] = weekly_game_counter
-            league['history'] = {'Record':''}
-            league["total_salary"][league.team_id == str(id)] = sum(
-                [int(x[0]) for x in salary_list]
-            )
-            
-            # Record data on roster df
-            for name, sal, pos in zip(player_names, salary_list, positions):
-                roster["salary"][roster.index == str(name)] = int(sal[0])
-                roster["contract"][roster.index == str(name)] = sal[1]
-                roster["position"][roster.index == str(name)] = pos.replace(",", "")
+        # Record data on league df (one join on team_id)
+        league_totals = league[["team_id"]].join(teams.set_index("team_id"), on="team_id")
+        league = league.assign(
+            weekly_games=league_totals["weekly_games"].to_numpy(),
+            total_salary=league_totals["total_salary"].to_numpy(),
+        )
+        league['history'] = {'Record':''}
+
+        # Record data on roster df (one join on player name; a player listed twice keeps the last team page's values)
+        team_players = players.drop_duplicates(subset="player_name", keep="last").set_index("player_name")
+        matched = roster[[]].join(team_players, how="left")
+        on_team = matched["salary"].notna().to_numpy()
+        roster = roster.assign(
+            salary=np.where(on_team, matched["salary"].to_numpy(), roster["salary"].to_numpy()).astype(roster["salary"].dtype),
+            contract=np.where(on_team, matched["contract"].to_numpy(dtype=object), roster["contract"].to_numpy(dtype=object)),
+            position=np.where(on_team, matched["position"].to_numpy(dtype=object), roster["position"].to_numpy(dtype=object)),
+        )
 
         return league, roster
 
     def _zroster_builder(self, roster, draft=False):
-        """ Outputs a df roster of zscores """
+        """ Outputs a df roster of zscores (computed column-wise over config["tracked_zcats"]) """
         
         #Pare the roster of players who haven't played games (avoid skewing zscores)
         roster = roster.loc[roster['g'] > 0]
         
         exclusions = ["player_name", "g", "zrank", 'team_id']
+        data_cats = [x for x in self.config["tracked_zcats"] if x not in exclusions]
+        z_cats = [x for x in data_cats if x not in ZCAT_IMPACT.values()]
+        
+        # League averages/stdevs per category (one pass over the whole frame)
+        data_avg = roster[data_cats].mean()
+        data_stdev = roster[data_cats].std()
         
-        data_refs = {
-            **{
-            str(x + "-avg"): None
-            for x in self.config["tracked_zcats"]
-            if x not in exclusions
-        },
-            **{
-            str(x + "-stdev"): None
-            for x in self.config["tracked_zcats"]
-            if x not in exclusions
-        }}
-
-        for x in self.config["tracked_zcats"]:
-            if x not in exclusions:
-                data_refs.update({str(x + "-avg"): roster[x].mean()})
-                data_refs.update({str(x + "-stdev"): roster[x].std()})
-
-        roster["fg-impact"] = roster.apply(
-            lambda row: (row.fgp - data_refs.get("fgp-avg")) * row.fgpg, axis=1
-        ).round(3)
-        roster["ft-impact"] = roster.apply(
-            lambda row: (row.ftp - data_refs.get("ftp-avg")) * row.ftpg, axis=1
-        ).round(3)
-
-        data_refs["fg-impact-stdev"] = roster["fg-impact"].std()
-        data_refs["ft-impact-stdev"] = roster["ft-impact"].std()
-
-        data_refs["fg-impact-avg"] = roster["fg-impact"].mean()
-        data_refs["ft-impact-avg"] = roster["ft-impact"].mean()
-
         # Build the z-roster
-        z_df = pd.DataFrame(columns=self.config["tracked_zcats"])
-
-        for index, row in roster.iterrows():
-            new_entry = {
-                "player_name": [index],
-                "g": [row["g"]],
-                "fgpg": [
-                    round(
-                        (
-                            ((row["fgp"] - data_refs["fgp-avg"]) * row["fgpg"])
-                            - data_refs["fg-impact-avg"]
-                        )
-                        / data_refs["fg-impact-stdev"],
-                        3,
-                    )
-                ],
-                "ftpg": [
-                    round(
-                        (
-                            ((row["ftp"] - data_refs["ftp-avg"]) * row["ftpg"])
-                            - data_refs["ft-impact-avg"]
-                        )
-                        / data_refs["ft-impact-stdev"],
-                        3,
-                    )
-                ],
-                "3ptpg": [
-                    round(
-                        (row["3ptpg"] - data_refs["3ptpg-avg"])
-                        / data_refs["3ptpg-stdev"],
-                        3,
-                    )
-                ],
-                "rpg": [
-                    round(
-                        (row["rpg"] - data_refs["rpg-avg"]) / data_refs["rpg-stdev"], 3
-                    )
-                ],
-                "apg": [
-                    round(
-                        (row["apg"] - data_refs["apg-avg"]) / data_refs["apg-stdev"], 3
-                    )
-                ],
-                "spg": [
-                    round(
-                        (row["spg"] - data_refs["spg-avg"]) / data_refs["spg-stdev"], 3
-                    )
-                ],
-                "tpg": [
-                    round(
-                        ((row["tpg"] - data_refs["tpg-avg"]) / data_refs["tpg-stdev"])
-                        * -1,
-                        3,
-                    )
-                ],
-                "bpg": [
-                    round(
-                        (row["bpg"] - data_refs["bpg-avg"]) / data_refs["bpg-stdev"], 3
-                    )
-                ],
-                "ppg": [
-                    round(
-                        (row["ppg"] - data_refs["ppg-avg"]) / data_refs["ppg-stdev"], 3
-                    )
-                ],
-                "team_id": [int(row["team_id"])],
-            }
-
-            z_df = pd.concat([pd.DataFrame.from_dict(new_entry), z_df])
-
-        # Player zrank
-        z_df["zrank"] = z_df.apply(
-            lambda row: sum(
-                [
-                    row[x]
-                    for x in self.config["tracked_zcats"]
-                    if x not in exclusions and x != "fgp" and x != "ftp"
-                ]
-            ),
-            axis=1,
-        ).round(3)
-
+        z_values = {"player_name": roster.index.to_numpy(), "g": roster["g"].to_numpy()}
+        
+        for x in z_cats:
+            if x in ZCAT_IMPACT:
+                # Percentage cats are weighted by volume: z score of (pct - avg pct) * attempts
+                pct = ZCAT_IMPACT[x]
+                impact = (roster[pct].to_numpy() - data_avg[pct]) * roster[x].to_numpy()
+                impact_rounded = pd.Series(impact).round(3)
+                z = (impact - impact_rounded.mean()) / impact_rounded.std()
+            else:
+                z = (roster[x].to_numpy() - data_avg[x]) / data_stdev[x]
+            if x in ZCAT_NEGATIVE:
+                z = z * -1
+            z_values[x] = np.round(z, 3)
+        
+        z_values["team_id"] = roster["team_id"].to_numpy().astype(int)
+        
+        # Rows in reverse roster order, as the row-by-row builder produced them
+        z_df = pd.DataFrame(
+            {x: y[::-1] for x, y in z_values.items()},
+            columns=list(z_values) + [x for x in self.config["tracked_zcats"] if x not in z_values],
+        )
+        
+        # Player zrank (category columns summed in order)
+        z_df["zrank"] = _column_sum(z_df, z_cats).round(3)
+        
         # Adjusted player zrank (takes punted cats into consideration)
-        z_df["adj-zrank"] = z_df.apply(
-            lambda row: sum(
-                [
-                    row[x]
-                    for x in self.config["tracked_zcats"]
-                    if x not in exclusions
-                    and x not in self.punts
-                    and x != "fgp"
-                    and x != "ftp"
-                ]
-            ),
-            axis=1,
-        ).round(3)
-
+        z_df["adj-zrank"] = _column_sum(z_df, [x for x in z_cats if x not in self.punts]).round(3)
+        
         if draft == True:
             # Calculate relative $ value
-            z_df["draft"] = (
-                z_df.apply(
-                    lambda row: (row["zrank"] / z_df["zrank"].sum())
-                    * self.config["league_total_budget"] * -1,
-                    axis=1,
-                )
-                .astype("int")
-            )
-            
+            z_df["draft"] = ((z_df["zrank"] / z_df["zrank"].sum()) * self.config["league_total_budget"] * -1).astype("int")
             
             # Calculate relative $ value
-            z_df["adj-draft"] = (
-                z_df.apply(
-                    lambda row: (row["adj-zrank"] / z_df["adj-zrank"].sum())
-                    * self.config["league_total_budget"] * -1,
-                    axis=1,
-                )
-                .astype("int")
-            )
+            z_df["adj-draft"] = ((z_df["adj-zrank"] / z_df["adj-zrank"].sum()) * self.config["league_total_budget"] * -1).astype("int")
         else: pass
         
         #Normalize the zranks
@@ -775,9 +1543,7 @@ class CBS:
         z_df['adj-zrank'] = round((z_df['adj-zrank'] - z_df['adj-zrank'].min()) / (z_df['adj-zrank'].max() - z_df['adj-zrank'].min()) * 100, 0).astype('int')
 
         # Zrank dif (shows impact of punting cats)
-        z_df["z-dif"] = z_df.apply(
-            lambda row: (row["zrank"] - row["adj-zrank"]) * -1, axis=1
-        ).round(3)
+        z_df["z-dif"] = ((z_df["zrank"] - z_df["adj-zrank"]) * -1).round(3)
 
         if draft == True:
             # #Normalize the draft values
@@ -788,14 +1554,71 @@ class CBS:
         else: pass
         
         # Cleanup the df
-        z_df = z_df.drop(columns=["fgp", "ftp"]).rename(
-            columns={"fgpg": "fg", "ftpg": "ft", "3ptpg": "3p"}
-        )
+        z_df = z_df.drop(columns=["fgp", "ftp"]).rename(columns=ZCAT_RENAMES)
         
         z_df.set_index(["player_name"], inplace=True)
         
         return z_df
 
+    def _zscore_cats(self):
+        """ Category z-score columns of self.zscores (the cats summed into zrank), in config order """
+        exclusions = ["player_name", "g", "zrank", "team_id"]
+        return [
+            ZCAT_RENAMES.get(x, x)
+            for x in self.config["tracked_zcats"]
+            if x not in exclusions and x not in ZCAT_IMPACT.values()
+        ]
+
+    def punt_table(self, k=2):
+        """ Adjusted zranks and auction values for every punt set of up to k cats, all players at once; cached per k (player x punt-set) """
+
+        if k in self._punt_tables:
+            return self._punt_tables[k]
+
+        cats = self._zscore_cats()
+        punt_sets = [p for size in range(0, k + 1) for p in combinations(cats, size)]
+        labels = ["+".join(p) if p else "none" for p in punt_sets]
+
+        # Category-kept mask (cats x punt sets); one matrix product gives every player's total for every punt set
+        kept = np.array([[x not in p for p in punt_sets] for x in cats], dtype=float)
+        adj_zrank = (self.zscores[cats].to_numpy(dtype=float) @ kept).round(3)
+
+        # $ value above replacement; zscores are mean-centred, so values are measured from the
+        # best player left once every rostered spot is filled, not as a share of the (near zero) column total
+        rostered = int((self.zscores["team_id"] > 0).sum()) or len(self.zscores)
+        adj_draft = _auction_values(adj_zrank, rostered, self.config["league_total_budget"])
+
+        # Normalize each punt set's column (zranks 0-100, draft values 0-65)
+        adj_zrank = np.round(_min_max(adj_zrank) * 100, 0).astype(int)
+        adj_draft = np.round(_min_max(adj_draft) * 65, 0).astype(int)
+
+        table = pd.concat(
+            {
+                "adj-zrank": pd.DataFrame(adj_zrank, index=self.zscores.index, columns=labels),
+                "adj-draft": pd.DataFrame(adj_draft, index=self.zscores.index, columns=labels),
+            },
+            axis=1,
+        )
+        self._punt_tables[k] = table
+        return table
+
+    def punt(self, *args, top=20):
+        """ Tool to lookup the best players (adj-zrank and adj-draft) for a punt strategy, e.g. punt('ft', 'tpg') """
+
+        cats = self._zscore_cats()
+        punts = [ZCAT_RENAMES.get(x, x) for x in args]
+        if any(x not in cats for x in punts):
+            print(f'No proper categories input; try one of the following: {cats}')
+            return
+
+        label = "+".join(x for x in cats if x in punts) if punts else "none"
+        table = self.punt_table(k=max(2, len(punts)))
+        output = pd.DataFrame(
+            {"adj-zrank": table[("adj-zrank", label)], "adj-draft": table[("adj-draft", label)]}
+        ).sort_values(by="adj-zrank", ascending=False)
+        print(output.head(top))
+        return output
+
     def z(self, *args, cats=None):
         """ Tool to lookup zranks (players and teams) """
         
@@ -809,29 +1632,57 @@ class CBS:
                 print(f'No proper categories input; try one of the following: {cats_list}')
                 
         else: 
-            team_dict = {x:y for x, y in zip(self.league_df.index.tolist(), self.league_df['team_id'].tolist())}
+            lookup = self._lookup
             for x in args:
                 #Check if it's a team. 
-                team_check = list(filter(lambda y: x in y, self.league_df.index.tolist()))
-                player_check = list(filter(lambda y: x in y, self.zscores.index.tolist()))
+                team_check = lookup["teams"].contains(x)
+                player_check = lookup["players"].contains(x)
                 
                 if len(team_check) == 0 and len(player_check) == 0:
                     continue 
                 elif len(team_check) == 1 and len(player_check) == 0:
-                    print(f'\nTEAM {team_check[0]}', self.zscores.loc[self.zscores['team_id'] == int(team_dict[team_check[0]])].sort_values(by='zrank')) 
+                    print(f'\nTEAM {team_check[0]}', self._team_zscores(team_check[0])) 
                 elif len(team_check) > 0 and len(player_check) > 0:
-                    print(f'\nTEAM {team_check[0]}:\n',self.zscores.loc[self.zscores['team_id'] == int(team_dict[team_check[0]])].sort_values(by='zrank'))
+                    print(f'\nTEAM {team_check[0]}:\n', self._team_zscores(team_check[0]))
                     if len(player_check) == 1:
-                        print('\n',self.zscores.loc[self.zscores.index == player_check[0]])
+                        print('\n',self.zscores.loc[[player_check[0]]])
                     else: 
                         for y in player_check:
-                            print('\n',self.zscores.loc[self.zscores.index == y])
+                            print('\n',self.zscores.loc[[y]])
                 elif len(player_check) == 1 and len(team_check) == 0:
-                    print(self.zscores.loc[self.zscores.index == player_check[0]])
+                    print(self.zscores.loc[[player_check[0]]])
                 elif len(player_check) > 1 and len(team_check) == 0:
                     for y in player_check:
-                        print(self.zscores.loc[self.zscores.index == y])
+                        print(self.zscores.loc[[y]])
                 else: pass
+
+    @cached_property
+    def _lookup(self):
+        """ Name indexes for players/teams plus each team's zscores slice (sorted by zrank); rebuilt after update() """
+        team_ids = {x: int(y) for x, y in zip(self.league_df.index.tolist(), self.league_df['team_id'].tolist())}
+        rosters = {
+            int(team_id): roster.sort_values(by='zrank')
+            for team_id, roster in self.zscores.groupby('team_id')
+        }
+        return {
+            "players": NameIndex(self.zscores.index.tolist()),
+            "teams": NameIndex(self.league_df.index.tolist()),
+            "team_ids": team_ids,
+            "rosters": rosters,
+        }
+
+    def _team_zscores(self, team_name):
+        """ Precomputed zscores slice for a team (empty if the team has no rostered players) """
+        team_id = self._lookup["team_ids"][team_name]
+        return self._lookup["rosters"].get(team_id, self.zscores.iloc[0:0])
+
+    def find(self, *args, limit=5):
+        """ Fuzzy player/team name search (tolerates typos), e.g. find('lebrn') """
+        lookup = self._lookup
+        return {
+            x: {"teams": lookup["teams"].fuzzy(x, limit=limit), "players": lookup["players"].fuzzy(x, limit=limit)}
+            for x in args
+        }
         
 
 if __name__ == "__main__":
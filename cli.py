@@ -0,0 +1,159 @@
+""" Command-line entry point for the pool tools, e.g.
+
+    python cli.py z lebron
+    python cli.py snapshot Taints --periods 1-6
+
+Each command only imports what it needs (cbs/analytics, and through them bs4/selenium/matplotlib on first use), so quick lookups start fast.
+"""
+import argparse
+import os
+import sys
+
+
+def _league(credentials=False, base_url=None):
+    """ CBS instance from the CBS_USER / CBS_PASS / CBS_CONFIG env values """
+    cbs_user = os.getenv("CBS_USER")
+    cbs_pass = os.getenv("CBS_PASS")
+    config_path = os.getenv("CBS_CONFIG")
+
+    if not config_path or (credentials and not (cbs_user and cbs_pass)):
+        print("Missing env values for CBS_USER / CBS_PASS / CBS_CONFIG")
+        sys.exit(1)
+
+    import pandas as pd
+    import cbs
+
+    pd.set_option("display.max_rows", None)
+    pd.set_option("display.max_colwidth", None)
+
+    return cbs.CBS(cbs_user, cbs_pass, config_path, base_url=base_url)
+
+
+def _periods(text: str) -> list:
+    """ Parses a period selection such as '1-6' or '1,3,5' """
+    periods = []
+    for part in text.split(","):
+        start, _, end = part.partition("-")
+        periods.extend(range(int(start), int(end or start) + 1))
+    return periods
+
+
+def _record(league, args):
+    """ league_record limited to the requested periods (all stored periods by default) """
+    record = league.record(periods=args.periods)
+    if args.periods is None:
+        args.periods = sorted(record["period"].unique().tolist())
+    return record
+
+
+def _update(args):
+    _league(credentials=True, base_url=args.base_url).update(refresh=args.refresh, workers=args.workers, browsers=args.browsers, profile=args.profile, rate=args.rate)
+
+
+def _z(args):
+    league = _league()
+    league.z(*args.names, cats=args.cats)
+
+
+def _faceoff(args):
+    league = _league()
+    record = _record(league, args)
+
+    import analytics
+
+    analytics.faceoff(record, args.team, args.periods)
+
+
+def _snapshot(args):
+    league = _league()
+    record = _record(league, args)
+
+    import analytics
+
+    analytics.snapshot(record, args.team, args.periods)
+
+
+def _strengths(args):
+    league = _league()
+    record = _record(league, args)
+
+    import analytics
+
+    analytics.team_strengths(record, args.team, args.periods, multi=args.multi)
+
+
+def _rankings(args):
+    league = _league()
+    record = _record(league, args)
+
+    import analytics
+
+    analytics.team_strengths(record, record.index[0], args.periods, Prankings=True)
+
+
+def _report(args):
+    league = _league()
+    record = _record(league, args)
+
+    import analytics
+
+    timings = analytics.report(record, args.periods, teams=args.teams or None, workers=args.workers)
+    if timings:
+        slowest = max(timings, key=timings.get)
+        print(f"Rendered {len(timings)} charts to images/report/ ({sum(timings.values()):.2f}s of rendering; slowest {os.path.basename(slowest)} {timings[slowest]:.2f}s)")
+
+
+def _memory(args):
+    league = _league()
+    print(league.memory_report())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fantasy basketball pool tools (reads the local html/pickle/parquet data)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    update = commands.add_parser("update", help="scrape CBS and rebuild the local data")
+    update.add_argument("--refresh", action="store_true", help="rescrape every period's weekly results")
+    update.add_argument("--workers", type=int, default=8)
+    update.add_argument("--browsers", type=int, default=3)
+    update.add_argument("--rate", type=float, default=5.0, help="most requests per second sent to CBS")
+    update.add_argument("--base-url", help="scrape another host instead of the CBS site (e.g. benchmarks/fixture_server.py)")
+    update.add_argument("--profile", action="store_true", help="add cProfile/tracemalloc output to logs/update_metrics.json")
+    update.set_defaults(func=_update)
+
+    z = commands.add_parser("z", help="zscores of players/teams (or the top players of categories with --cats)")
+    z.add_argument("names", nargs="+")
+    z.add_argument("--cats", action="store_true", help="treat the names as zscore categories")
+    z.set_defaults(func=_z)
+
+    for name, func, help in [
+        ("faceoff", _faceoff, "hypothetical matchups of a team against the field"),
+        ("snapshot", _snapshot, "cat-by-cat snapshot chart of a team (images/team_snapshot.png)"),
+        ("strengths", _strengths, "relative cat strengths chart of a team"),
+    ]:
+        command = commands.add_parser(name, help=help)
+        command.add_argument("team")
+        command.add_argument("--periods", type=_periods, help="e.g. 1-6 or 1,3,5 (default: all)")
+        if name == "strengths":
+            command.add_argument("--multi", action="store_true", help="chart the entire league")
+        command.set_defaults(func=func)
+
+    rankings = commands.add_parser("rankings", help="power rankings for the league")
+    rankings.add_argument("--periods", type=_periods, help="e.g. 1-6 or 1,3,5 (default: all)")
+    rankings.set_defaults(func=_rankings)
+
+    report = commands.add_parser("report", help="every team's charts, rendered in parallel to images/report/")
+    report.add_argument("teams", nargs="*")
+    report.add_argument("--periods", type=_periods, help="e.g. 1-6 or 1,3,5 (default: all)")
+    report.add_argument("--workers", type=int, help="render processes (default: all cores)")
+    report.set_defaults(func=_report)
+
+    memory = commands.add_parser("memory", help="memory footprint and dtypes of the stored frames")
+    memory.set_defaults(func=_memory)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()